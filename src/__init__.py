@@ -1,90 +1,91 @@
 import sys
+import importlib
 
 app = None
-event_create = None
-Button, CheckBox, RadioBox, Bitmap, Text, TextControl, \
-    Calendar, SpinControl, Menu, TextTimedMenu = [None] * 10
-Grid = None
-Frame, Dialog, MessageDialog = [None] * 3
-VBoxLayout, HBoxLayout, GridLayout = [None] * 3
 gui_type = None
 initialize_error_message = "The prettysusi library has not been initialized\nRun prettysusi.initialize(GUI_TYPE)."
 
+# Public names provided by the selected GUI backend, resolved on first access
+_LAZY_IMPORTS = {
+    'event_create': '',
+    'Button': '.widgets',
+    'CheckBox': '.widgets',
+    'RadioBox': '.widgets',
+    'Bitmap': '.widgets',
+    'Text': '.widgets',
+    'TextControl': '.widgets',
+    'Calendar': '.widgets',
+    'SpinControl': '.widgets',
+    'Menu': '.widgets',
+    'TextTimedMenu': '.widgets',
+    'Grid': '.tables',
+    'Frame': '.frames',
+    'Dialog': '.frames',
+    'MessageDialog': '.frames',
+    'VBoxLayout': '.layouts',
+    'HBoxLayout': '.layouts',
+    'GridLayout': '.layouts',
+}
+
+__all__ = ['app', 'gui_type', 'initialize', *_LAZY_IMPORTS]
+
+# Application class, main loop method and setup step of each supported GUI
+_BACKENDS = {
+    'wx': {'app_cls': ('wx', 'App', ()), 'run_attr': 'MainLoop', 'post': None},
+    'qt': {'app_cls': ('PySide6.QtWidgets', 'QApplication', ([],)), 'run_attr': 'exec', 'post': None},
+    'tk': {'app_cls': ('tkinter', 'Tk', ()), 'run_attr': 'mainloop', 'post': lambda app: app.withdraw()}
+}
+
+
+def __getattr__(name):
+
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    if gui_type is None:
+        raise AttributeError(initialize_error_message)
+
+    try:
+        module = importlib.import_module(f'.{gui_type}{_LAZY_IMPORTS[name]}', __package__)
+    except ImportError as e:
+        raise ImportError(f"The required GUI '{gui_type}' cannot be loaded correctly: {e}") from e
+
+    value = getattr(module, name)
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 def initialize(gui):
 
-    global app, event_create
-    global Button, CheckBox, RadioBox, Bitmap, Text, TextControl, Calendar, SpinControl, Menu, TextTimedMenu
-    global Grid
-    global Frame, Dialog, MessageDialog
-    global VBoxLayout, HBoxLayout, GridLayout
+    global app
     global gui_type
 
-    if gui == 'wx':
-        # Import WxPython GUI
-        try:
-            from wx import App
-
-            from .wx import event_create
-            from .wx.widgets import Button, CheckBox, RadioBox, Bitmap, Text, TextControl, \
-                Calendar, SpinControl, Menu, TextTimedMenu
-            from .wx.layouts import VBoxLayout, HBoxLayout, GridLayout
-            from .wx.frames import Frame, Dialog, MessageDialog
-            from .wx.tables import Grid
-
-            app = App()
-            app.run = app.MainLoop
-            gui_type = 'wx'
-
-        except ImportError as e:
-            print("Fatal error: the required GUI 'wx' cannot be loaded correctly")
-            print(e)
-            sys.exit(1)
-
-    elif gui == 'qt':
-        # Import Qt GUI
-        try:
-            from PySide6.QtWidgets import QApplication
-
-            from .qt import event_create
-            from .qt.widgets import Button, CheckBox, RadioBox, Bitmap, Text, TextControl, \
-                Calendar, SpinControl, Menu, TextTimedMenu
-            from .qt.tables import Grid
-            from .qt.frames import Frame, Dialog, MessageDialog
-            from .qt.layouts import VBoxLayout, HBoxLayout, GridLayout
-
-            app = QApplication([])
-            app.run = app.exec
-            gui_type = 'qt'
-
-        except ImportError as e:
-            print("Fatal error: the required GUI 'qt' cannot be loaded correctly")
-            print(e)
-            sys.exit(1)
-
-    elif gui == 'tk':
-        # Import tkinter GUI
-        try:
-            from tkinter import Tk, ttk
-            app = Tk()
-
-            from .tk import event_create
-            from .tk.widgets import Button, CheckBox, RadioBox, Bitmap, Text, TextControl, \
-                Calendar, SpinControl, Menu, TextTimedMenu
-            from .tk.tables import Grid
-            from .tk.frames import Frame, Dialog, MessageDialog
-            from .tk.layouts import VBoxLayout, HBoxLayout, GridLayout
-
-            app.withdraw()
-            app.run = app.mainloop
-            gui_type = 'tk'
-
-        except ImportError as e:
-            print("Fatal error: the required GUI 'tk' cannot be loaded correctly")
-            print(e)
-            sys.exit(1)
-
-    else:
+    if gui not in _BACKENDS:
         # An invalid GUI has been requested
         print(f"Fatal error: the required GUI '{gui}' is not valid")
         sys.exit(1)
+
+    # Create the application of the requested GUI
+    backend = _BACKENDS[gui]
+    app_module, app_class, app_args = backend['app_cls']
+    try:
+        app = getattr(importlib.import_module(app_module), app_class)(*app_args)
+
+    except ImportError as e:
+        print(f"Fatal error: the required GUI '{gui}' cannot be loaded correctly")
+        print(e)
+        sys.exit(1)
+
+    if backend['post'] is not None:
+        backend['post'](app)
+    app.run = getattr(app, backend['run_attr'])
+    gui_type = gui
+
+    # Names cached from a previously selected GUI are resolved again on next access
+    module_dict = sys.modules[__name__].__dict__
+    for name in _LAZY_IMPORTS:
+        module_dict.pop(name, None)
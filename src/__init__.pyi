@@ -0,0 +1,27 @@
+from typing import Any, Callable
+
+app: Any
+gui_type: str | None
+initialize_error_message: str
+
+event_create: Callable[[], Any]
+Button: type
+CheckBox: type
+RadioBox: type
+Bitmap: type
+Text: type
+TextControl: type
+Calendar: type
+SpinControl: type
+Menu: type
+TextTimedMenu: type
+Grid: type
+Frame: type
+Dialog: type
+MessageDialog: type
+VBoxLayout: type
+HBoxLayout: type
+GridLayout: type
+
+
+def initialize(gui: str) -> None: ...
@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 from enum import Enum, auto
+import threading
 from .. import event_create
 from src.config import ASSETS_PATH_ICONS
 
@@ -21,16 +23,22 @@ class AbstractFrame:
     _STYLE = FrameStyle.NORMAL
     _close_event = event_create()
     _update_gui_event = event_create()
+    # Events connected to their handlers at construction, extended by subclasses adding events
+    _EVENT_BINDINGS = (('_close_event', '_on_close_event'), ('_update_gui_event', '_on_update_gui_event'))
 
     def __init__(self, *, parent=None, title="", icon=None):
         self.parent = parent
         if parent is not None:
-            parent.child_views.append(self)
-        self.child_views = []
+            parent._child_views[id(self)] = self
+        # Child frames keyed by id, so that detaching a child does not scan the others
+        self._child_views = {}
+        # Data of the updates requested from other threads, not yet applied by the GUI thread
+        self._pending_update_data = []
+        self._pending_update_lock = threading.Lock()
         self.title = title
         self.icon = icon
-        self.event_connect(self._close_event, self._on_close_event)
-        self.event_connect(self._update_gui_event, self._on_update_gui_event)
+        for event, on_event in self._EVENT_BINDINGS:
+            self.event_connect(getattr(self, event), getattr(self, on_event))
 
     def event_connect(self, event, on_event):
         raise NotImplementedError
@@ -38,6 +46,11 @@ class AbstractFrame:
     def event_trigger(self, event, **kwargs):
         raise NotImplementedError
 
+    @property
+    def child_views(self):
+        # Read-only live view of the child frames, in creation order
+        return self._child_views.values()
+
     @property
     def title(self):
         return self._title
@@ -71,7 +84,7 @@ class AbstractFrame:
 
     def detach(self):
         if self.parent is not None:
-            self.parent.child_views.remove(self)
+            self.parent._child_views.pop(id(self), None)
 
     def on_close(self, obj):
         #
@@ -96,14 +109,32 @@ class AbstractFrame:
     def _on_close_event(self):
         self.close()
 
-    def _on_update_gui_event(self, data):
-        self.update_gui(data)
+    def _on_update_gui_event(self):
+        with self._pending_update_lock:
+            pending_data = self._pending_update_data
+            self._pending_update_data = []
+        for data in pending_data:
+            self.update_gui(data)
 
     def close_from_thread(self):
         self.event_trigger(self._close_event)
 
     def update_gui_from_thread(self, data):
-        self.event_trigger(self._update_gui_event, data=data)
+        # Mapping payloads arriving before the pending one is applied are merged into it, unless they
+        # share a key with it; any other payload (None included) is passed to update_gui unchanged
+        with self._pending_update_lock:
+            pending_data = self._pending_update_data
+            trigger = not pending_data
+            if isinstance(data, Mapping):
+                last_data = pending_data[-1] if pending_data else None
+                if isinstance(last_data, dict) and last_data.keys().isdisjoint(data):
+                    last_data.update(data)
+                else:
+                    pending_data.append(dict(data))
+            else:
+                pending_data.append(data)
+        if trigger:
+            self.event_trigger(self._update_gui_event)
 
 
 class AbstractIconFrame(AbstractFrame):
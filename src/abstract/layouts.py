@@ -1,4 +1,6 @@
+from array import array
 from enum import Flag, auto
+from types import MappingProxyType
 
 
 class Align(Flag):
@@ -14,38 +16,94 @@ class Align(Flag):
     EXPAND = auto()
 
 
+# Integer masks of the Align flags, used by the backends when translating alignments
+LEFT_MASK = Align.LEFT.value
+HCENTER_MASK = Align.HCENTER.value
+RIGHT_MASK = Align.RIGHT.value
+TOP_MASK = Align.TOP.value
+VCENTER_MASK = Align.VCENTER.value
+BOTTOM_MASK = Align.BOTTOM.value
+START_MASK = Align.START.value
+CENTER_MASK = Align.CENTER.value
+END_MASK = Align.END.value
+EXPAND_MASK = Align.EXPAND.value
+
+# Grid row/column stretch of the rows and columns that do not grow
+NO_STRETCH = -1
+
+
+def _align_mask(align):
+    if isinstance(align, Align):
+        return align.value
+    return align
+
+
+def _border_tuple(border):
+    # Borders are stored as (top, right, bottom, left)
+    if isinstance(border, int):
+        return (border,) * 4
+    return tuple(border)
+
+
+# Shared read-only entry of the grid cells that have not been filled
+_EMPTY_CELL = MappingProxyType({'type': None})
+
+
 class AbstractLayout:
+    __slots__ = ()
 
     def create_layout(self, parent):
         raise NotImplementedError()
 
 
 class AbstractBoxLayout(AbstractLayout):
+    __slots__ = ('_kinds', '_types', '_aligns', '_borders', '_stretches', '_spaces')
+
     def __init__(self):
-        self._widgets = []
+        # One list per field, all indexed by the position of the entry
+        self._kinds = []
+        self._types = []
+        self._aligns = []
+        self._borders = []
+        self._stretches = []
+        self._spaces = []
 
     def add(self, widget, align=Align.START, border=0, stretch=0):
-        self._widgets.append({'type': widget, 'align': align, 'border': border, 'stretch': stretch})
+        self._append('widget', widget, _align_mask(align), _border_tuple(border), stretch, None)
 
     def add_space(self, space):
-        self._widgets.append({'type': 'space', 'space': space})
+        self._append('space', None, None, None, None, space)
 
     def add_stretch(self, stretch=1):
-        self._widgets.append({'type': 'stretch', 'stretch': stretch})
+        self._append('stretch', None, None, None, stretch, None)
+
+    def items(self):
+        return zip(self._kinds, self._types, self._aligns, self._borders, self._stretches, self._spaces)
+
+    def _append(self, kind, widget, align, border, stretch, space):
+        self._kinds.append(kind)
+        self._types.append(widget)
+        self._aligns.append(align)
+        self._borders.append(border)
+        self._stretches.append(stretch)
+        self._spaces.append(space)
 
 
 class AbstractGridLayout(AbstractLayout):
+    __slots__ = ('_rows', '_cols', '_widgets', '_row_stretch', '_col_stretch', '_vgap', '_hgap')
+
     def __init__(self, rows, cols, vgap, hgap):
         self._rows = rows
         self._cols = cols
-        self._widgets = [[None] * self._cols for _ in range(self._rows)]
-        self._row_stretch = [None] * self._rows
-        self._col_stretch = [None] * self._rows
+        self._widgets = [[_EMPTY_CELL] * self._cols for _ in range(self._rows)]
+        # Rows/columns whose stretch has not been set hold NO_STRETCH and do not grow
+        self._row_stretch = array('i', [NO_STRETCH] * self._rows)
+        self._col_stretch = array('i', [NO_STRETCH] * self._cols)
         self._vgap = vgap
         self._hgap = hgap
 
     def add(self, row, col, widget, align=Align.CENTER, border=0):
-        self._widgets[row][col] = {'type': widget, 'align': align, 'border': border}
+        self._widgets[row][col] = {'type': widget, 'align': _align_mask(align), 'border': _border_tuple(border)}
 
     def add_space(self, row, col, width, height):
         self._widgets[row][col] = {'type': 'space', 'width': width, 'height': height}
@@ -54,7 +112,7 @@ class AbstractGridLayout(AbstractLayout):
         raise NotImplementedError()
 
     def row_stretch(self, row, stretch):
-        self._row_stretch[row] = stretch
+        self._row_stretch[row] = NO_STRETCH if stretch is None else stretch
 
     def col_stretch(self, col, stretch):
-        self._col_stretch[col] = stretch
+        self._col_stretch[col] = NO_STRETCH if stretch is None else stretch
@@ -1,15 +1,16 @@
-from enum import Enum, auto
+from array import array
+from enum import IntEnum, auto
 
 from .widgets import AbstractWidget, TextStyle
 
 
-class Align(Enum):
+class Align(IntEnum):
     LEFT = auto()
     CENTER = auto()
     RIGHT = auto()
 
 
-class Renderer(Enum):
+class Renderer(IntEnum):
     NORMAL = auto()
     BOOLEAN = auto()
     AUTO_WRAP = auto()
@@ -42,6 +43,22 @@ class AbstractGrid(AbstractWidget):
 
     def __init__(self, **kwargs):
         self._col_widths = None
+        # Number of rows and columns, taken at the start of each refresh
+        self._shape_cache = (0, 0)
+        # Colour, style, align and renderer of the cells, valid until the next refresh
+        self._cell_meta_cache = {}
+        # Getters left to their defaults are replaced by their constant results
+        grid_class = type(self)
+        self._has_custom_colour = grid_class._get_colour is not AbstractGrid._get_colour \
+            or grid_class._get_row_colour is not AbstractGrid._get_row_colour \
+            or grid_class._get_row_col_colour is not AbstractGrid._get_row_col_colour
+        self._has_custom_style = grid_class._get_style is not AbstractGrid._get_style
+        self._has_custom_align = grid_class._get_align is not AbstractGrid._get_align
+        self._has_custom_renderer = grid_class._get_renderer is not AbstractGrid._get_renderer
+        if self._has_custom_colour or self._has_custom_style or self._has_custom_align or self._has_custom_renderer:
+            self._default_cell_meta = None
+        else:
+            self._default_cell_meta = (self._NORMAL_COLOUR, TextStyle.NORMAL, Align.LEFT, Renderer.NORMAL)
         super().__init__(**kwargs)
 
     def _get_number_rows(self):
@@ -53,6 +70,10 @@ class AbstractGrid(AbstractWidget):
     def _get_value(self, row, col):
         raise NotImplementedError
 
+    def _get_row_values(self, row):
+        # Values of a whole row, for subclasses that can fetch them in one go from their data
+        return [self._get_value(row, col) for col in range(self._shape_cache[1])]
+
     def _get_row_label_value(self, row):
         return ""
 
@@ -83,12 +104,31 @@ class AbstractGrid(AbstractWidget):
     def _get_renderer(self, row, col):
         return Renderer.NORMAL
 
+    def _refresh_shape(self):
+        self._shape_cache = (self._get_number_rows(), self._get_number_cols())
+        return self._shape_cache
+
+    def _cell_meta(self, row, col):
+        if self._default_cell_meta is not None:
+            return self._default_cell_meta
+        meta = self._cell_meta_cache.get((row, col))
+        if meta is None:
+            meta = (self._get_colour(row, col) if self._has_custom_colour else self._NORMAL_COLOUR,
+                    self._get_style(row, col) if self._has_custom_style else TextStyle.NORMAL,
+                    self._get_align(row, col) if self._has_custom_align else Align.LEFT,
+                    self._get_renderer(row, col) if self._has_custom_renderer else Renderer.NORMAL)
+            self._cell_meta_cache[(row, col)] = meta
+        return meta
+
     def _get_row_size(self, row):
         raise NotImplementedError
 
     def _get_col_size(self, col):
         raise NotImplementedError
 
+    def _get_all_col_sizes(self):
+        return [self._get_col_size(col) for col in range(self._get_number_cols())]
+
     def _set_row_size(self, row, size):
         raise NotImplementedError
 
@@ -137,19 +177,30 @@ class AbstractGrid(AbstractWidget):
         pass
 
     def freeze_cols_width(self):
-        self._col_widths = []
-        for col in range(self._get_number_cols()):
-            self._col_widths.append(self._get_col_size(col))
+        self._col_widths = array('i', self._get_all_col_sizes())
 
     def set_cols_width_as(self, other_grid):
-        self._col_widths = []
-        for col in range(other_grid._get_number_cols()):
-            self._col_widths.append(other_grid._get_col_size(col))
+        self._col_widths = array('i', other_grid._get_all_col_sizes())
 
     def _set_frozen_cols_width(self):
         if self._col_widths is not None:
+            self._set_col_sizes_from_list(self._col_widths)
+
+    def _set_col_sizes_from_list(self, widths):
+        self._begin_batch()
+        try:
             for col in range(self._get_number_cols()):
-                self._set_col_size(col, self._col_widths[col])
+                self._set_col_size(col, widths[col])
+        finally:
+            self._end_batch()
+
+    def _begin_batch(self):
+        #
+        pass
+
+    def _end_batch(self):
+        #
+        pass
 
     def unfreeze_cols_width(self):
         self._col_widths = None
@@ -1,9 +1,10 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 import datetime
-from threading import Timer
+import math
+import sys
 
 
-class TextStyle(Enum):
+class TextStyle(IntEnum):
     NORMAL = auto()
     BOLD = auto()
     ITALIC = auto()
@@ -70,7 +71,8 @@ class AbstractLabelledWidget(AbstractWidget):
 
     @label.setter
     def label(self, label):
-        self._label = label
+        # Equal labels share one string, so lookups keyed on them compare by identity
+        self._label = sys.intern(label) if type(label) is str else label
 
 
 class AbstractButton(AbstractLabelledWidget):
@@ -108,6 +110,7 @@ class AbstractRadioBox(AbstractLabelledWidget):
             self._choices = [''] * num_choices
         else:
             self._choices = choices
+        self._num_choices = len(self._choices)
         self._selection = selection
         if on_click is not None:
             self.on_click = on_click
@@ -122,11 +125,11 @@ class AbstractRadioBox(AbstractLabelledWidget):
 
     @selection.setter
     def selection(self, selection):
-        if 0 <= selection < len(self._choices):
+        if 0 <= selection < self._num_choices:
             self._selection = selection
 
     def set_string(self, index, string):
-        if 0 <= index < len(self._choices):
+        if 0 <= index < self._num_choices:
             self._choices[index] = string
 
 
@@ -151,8 +154,8 @@ class AbstractText(AbstractLabelledWidget):
                  foreground_color=None, background_color=None,
                  **kwargs):
         super().__init__(**kwargs)
-        self._font_size = font_size
-        self.font_style = font_style
+        # The style is stored directly so the font is built once, by the size setter
+        self._font_style = font_style
         self.font_size = font_size
         self._background_color = None
         self.foreground_color = foreground_color
@@ -190,18 +193,29 @@ class AbstractText(AbstractLabelledWidget):
     def background_color(self, background_color):
         self._background_color = background_color
 
+    def set_colors(self, foreground_color, background_color):
+        self._foreground_color = foreground_color
+        self._background_color = background_color
+        self._apply_colors()
+
+    def _apply_colors(self):
+        raise NotImplementedError
+
 
 class AbstractCalendar(AbstractWidget):
 
     def __init__(self, *, lower_date=None, upper_date=None, selected_date=None, **kwargs):
         super().__init__(**kwargs)
-        if selected_date is None:
-            selected_date = datetime.date.today()
+        # Without a selected date, today is taken when the date is first read
         self._selected_date = selected_date
         self._upper_date = upper_date
+        # Range limits with the missing ones replaced by the extreme dates
+        self._lower_limit = datetime.date.min
+        self._upper_limit = datetime.date.max if upper_date is None else upper_date
         self.lower_date = lower_date
         self.upper_date = upper_date
-        self.selected_date = selected_date
+        if selected_date is not None:
+            self.selected_date = selected_date
 
     @property
     def lower_date(self):
@@ -209,10 +223,15 @@ class AbstractCalendar(AbstractWidget):
 
     @lower_date.setter
     def lower_date(self, lower_date):
-        if lower_date is None or self._upper_date is None or lower_date <= self._upper_date:
+        if lower_date is None:
+            self._lower_date = None
+            self._lower_limit = datetime.date.min
+        elif lower_date <= self._upper_limit:
             self._lower_date = lower_date
-        if self._lower_date is not None and self.selected_date < self._lower_date:
-            self.selected_date = self._lower_date
+            self._lower_limit = lower_date
+            # A selection not taken yet is clamped to the range when first read
+            if self._selected_date is not None and self.selected_date < lower_date:
+                self.selected_date = lower_date
 
     @property
     def upper_date(self):
@@ -220,19 +239,27 @@ class AbstractCalendar(AbstractWidget):
 
     @upper_date.setter
     def upper_date(self, upper_date):
-        if upper_date is None or self._lower_date is None or upper_date >= self._lower_date:
+        if upper_date is None:
+            self._upper_date = None
+            self._upper_limit = datetime.date.max
+        elif upper_date >= self._lower_limit:
             self._upper_date = upper_date
-        if self._upper_date is not None and self.selected_date > self._upper_date:
-            self.selected_date = self._upper_date
+            self._upper_limit = upper_date
+            if self._selected_date is not None and self.selected_date > upper_date:
+                self.selected_date = upper_date
 
     @property
     def selected_date(self):
+        if self._selected_date is None:
+            self._selected_date = min(max(datetime.date.today(), self._lower_limit), self._upper_limit)
         return self._selected_date
 
     @selected_date.setter
     def selected_date(self, date):
-        if (self._lower_date is None or date >= self._lower_date) and \
-           (self._upper_date is None or date <= self._upper_date):
+        # A native calendar without a selection reports None, which keeps the current date
+        if date is None:
+            return
+        if self._lower_limit <= date <= self._upper_limit:
             self._selected_date = date
 
     def on_date_changed(self, obj):
@@ -250,6 +277,9 @@ class AbstractSpinControl(AbstractWidget):
         super().__init__(**kwargs)
         self._value = value
         self._max_value = max_value
+        # Range limits with the missing ones replaced by infinity
+        self._lower_limit = -math.inf
+        self._upper_limit = math.inf if max_value is None else max_value
         self.min_value = min_value
         self.max_value = max_value
         self.value = value
@@ -263,10 +293,14 @@ class AbstractSpinControl(AbstractWidget):
 
     @min_value.setter
     def min_value(self, min_value):
-        if min_value is None or self._max_value is None or min_value <= self._max_value:
+        if min_value is None:
+            self._min_value = None
+            self._lower_limit = -math.inf
+        elif min_value <= self._upper_limit:
             self._min_value = min_value
-        if self._min_value is not None and self.value < self._min_value:
-            self.value = self._min_value
+            self._lower_limit = min_value
+        if self.value < self._lower_limit:
+            self.value = self._lower_limit
 
     @property
     def max_value(self):
@@ -274,10 +308,14 @@ class AbstractSpinControl(AbstractWidget):
 
     @max_value.setter
     def max_value(self, max_value):
-        if max_value is None or self._min_value is None or max_value >= self._min_value:
+        if max_value is None:
+            self._max_value = None
+            self._upper_limit = math.inf
+        elif max_value >= self._lower_limit:
             self._max_value = max_value
-        if self._max_value is not None and self.value > self._max_value:
-            self.value = self._max_value
+            self._upper_limit = max_value
+        if self.value > self._upper_limit:
+            self.value = self._upper_limit
 
     @property
     def value(self):
@@ -285,8 +323,7 @@ class AbstractSpinControl(AbstractWidget):
 
     @value.setter
     def value(self, value):
-        if (self._min_value is None or value >= self._min_value) and \
-           (self._max_value is None or value <= self._max_value):
+        if self._lower_limit <= value <= self._upper_limit:
             self._value = value
 
     def on_click(self, obj):
@@ -297,17 +334,26 @@ class AbstractSpinControl(AbstractWidget):
 class AbstractMenu(AbstractLabelledWidget):
 
     SEPARATOR = None
+    _IS_MENU = True
+    # Kinds of the menu items, assigned when the items are added
+    _SEPARATOR_ITEM = 0
+    _MENU_ITEM = 1
+    _SIMPLE_ITEM = 2
 
     def __init__(self, *, items=None, on_click=None, **kwargs):
         super().__init__(**kwargs)
-        self._items = []
+        # One list per field, all indexed by the position of the item
+        self._item_kinds = []
+        self._item_objs = []
+        self._item_enabled = []
+        self._item_callbacks = []
         self._return_items = {}
         if items is not None:
             for item in items:
                 if isinstance(item, list) or isinstance(item, tuple):
-                    self._items.append(item)
+                    self.append(*item)
                 else:
-                    self._items.append((item, True, None))
+                    self.append(item)
         if on_click is not None:
             self.on_click = on_click
             self._inherit = False
@@ -315,22 +361,37 @@ class AbstractMenu(AbstractLabelledWidget):
             self._inherit = True
 
     def append(self, item, enabled=True, on_item_click=None):
-        self._items.append((item, enabled, on_item_click))
+        if type(item) is str:
+            item = sys.intern(item)
+        self._item_kinds.append(self._item_kind(item))
+        self._item_objs.append(item)
+        self._item_enabled.append(enabled)
+        self._item_callbacks.append(on_item_click)
+
+    def _items(self):
+        return zip(self._item_kinds, self._item_objs, self._item_enabled, self._item_callbacks)
+
+    def _item_kind(self, item):
+        if item is self.SEPARATOR:
+            return self._SEPARATOR_ITEM
+        elif getattr(item, '_IS_MENU', False):
+            return self._MENU_ITEM
+        else:
+            return self._SIMPLE_ITEM
 
     def build_menu(self, menubar=None, inherited_on_click=None):
         if self._inherit is True and inherited_on_click is not None:
             self.on_click = inherited_on_click
-        for menu_id, value in enumerate(self._items):
-            item, is_enabled, on_item_click = value
+        for kind, item, is_enabled, on_item_click in self._items():
             if menubar is not None:
-                self._append_menubar(menubar, item, is_enabled, on_item_click)
+                self._append_menubar(menubar, kind, item, is_enabled, on_item_click)
             else:
-                self._append_menu(item, is_enabled, on_item_click)
+                self._append_menu(kind, item, is_enabled, on_item_click)
 
-    def _append_menubar(self, menubar, item, is_enabled, on_item_click):
+    def _append_menubar(self, menubar, kind, item, is_enabled, on_item_click):
         raise NotImplementedError
 
-    def _append_menu(self, item, is_enabled, on_item_click):
+    def _append_menu(self, kind, item, is_enabled, on_item_click):
         raise NotImplementedError
 
     def on_click(self, obj, choice_id):
@@ -358,25 +419,30 @@ class AbstractTimedMenu(AbstractMenu):
 
     def command_close(self):
         if self._timer is None and not self._mouse_inside_widget():
-            self._timer = Timer(self._TIMER_DURATION, self._close)
-            self._timer.start()
+            self._timer = self._schedule(self._TIMER_DURATION, self._on_timer)
 
     def force_close(self):
-        if self._timer is not None:
-            self._timer.cancel()
-            self._timer = None
+        self.prevent_close()
         self._close()
 
     def prevent_close(self):
         if self._timer is not None:
-            self._timer.cancel()
+            self._cancel(self._timer)
             self._timer = None
 
+    def _on_timer(self):
+        self._timer = None
+        self._close()
+
     def _close(self):
-        if self._timer is not None:
-            self._timer.cancel()
-        else:
-            self._timer = None
+        self.prevent_close()
+
+    def _schedule(self, delay, function):
+        # Run function once after delay seconds, in the GUI thread
+        raise NotImplementedError
+
+    def _cancel(self, timer):
+        raise NotImplementedError
 
     def _on_mouse_enter(self, obj):
         self.prevent_close()
@@ -406,75 +472,161 @@ class AbstractTextTimedMenu(AbstractTimedMenu):
     _BACKGROUND_HIGHLIGHT_COLOR = (0, 120, 215)
     _FOREGROUND_DISABLED_COLOR = (80, 80, 80)
     _BACKGROUND_DISABLED_COLOR = (255, 255, 255)
+    # Show a disabled submenu as a single disabled item with its label
+    _COLLAPSE_WHEN_DISABLED = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._mouse_inside = {}
-        self._texts = {}
+        # Colour pairs of the items, read once from the class attributes
+        self._normal_colors = (self._FOREGROUND_NORMAL_COLOR, self._BACKGROUND_NORMAL_COLOR)
+        self._highlight_colors = (self._FOREGROUND_HIGHLIGHT_COLOR, self._BACKGROUND_HIGHLIGHT_COLOR)
+        self._disabled_colors = (self._FOREGROUND_DISABLED_COLOR, self._BACKGROUND_DISABLED_COLOR)
+        # Items currently under the mouse
+        self._mouse_inside = set()
+        # Callbacks of the items that have their own, in place of on_click
+        self._on_item_clicks = {}
+        # Enter and leave events of the items are merged until the GUI is idle
+        self._mouse_flush_pending = False
+        # Handle of the pending flush, None when the backend call cannot be cancelled
+        self._mouse_flush_call = None
+        self._mouse_was_inside = False
+        self._closed = False
 
     def _create_text(self, label):
         raise NotImplementedError
 
-    def _append_menu(self, item, is_enabled, on_item_click):
-        if isinstance(item, AbstractMenu):
-            for menu_id, value in enumerate(item._items):
-                sub_item, sub_is_enabled, sub_on_item_click = value
-                self._append_menu(sub_item, sub_is_enabled and is_enabled, sub_on_item_click)
-        else:
-            text = self._create_text(label=item)
-            self._mouse_inside[text] = False
-            self._texts[text] = item
-            self._return_items[text] = item
-            if item is not self.SEPARATOR and is_enabled:
-                if on_item_click is not None:
-                    text.on_left_down = lambda obj, pos: (self._close(), on_item_click())
-                    text.on_right_down = lambda obj, pos: (self._close(), on_item_click())
-                else:
-                    text.on_left_down = self._on_item_click
-                    text.on_right_down = self._on_item_click
-                text.on_mouse_enter = self._on_mouse_enter_item
-                text.on_mouse_leave = self._on_mouse_leave_item
-                self._set_normal_color(text)
+    def _call_after(self, function):
+        # Run function once when the GUI is idle, returning a handle for _cancel or None
+        raise NotImplementedError
+
+    def build_menu(self, menubar=None, inherited_on_click=None):
+        # The items are created with the window updates suspended
+        self._begin_batch()
+        try:
+            super().build_menu(menubar, inherited_on_click)
+        finally:
+            self._end_batch()
+
+    def _begin_batch(self):
+        #
+        pass
+
+    def _end_batch(self):
+        #
+        pass
+
+    def pop_up(self):
+        self._closed = False
+        self._reset_mouse_state()
+        super().pop_up()
+
+    def _close(self):
+        self._closed = True
+        if self._mouse_flush_call is not None:
+            self._cancel(self._mouse_flush_call)
+        self._reset_mouse_state()
+        super()._close()
+
+    def _reset_mouse_state(self):
+        # The items of a closed menu are not reused, so their mouse state is dropped
+        self._mouse_inside.clear()
+        self._mouse_flush_pending = False
+        self._mouse_flush_call = None
+        self._mouse_was_inside = False
+
+    def _append_menu(self, kind, item, is_enabled, on_item_click):
+        # Submenus are flattened in place, walking them with an explicit stack
+        stack = [(kind, item, is_enabled, on_item_click)]
+        while stack:
+            kind, item, is_enabled, on_item_click = stack.pop()
+            if kind == self._MENU_ITEM and not is_enabled and self._COLLAPSE_WHEN_DISABLED:
+                self._append_text(self._SIMPLE_ITEM, item.label, False, None)
+            elif kind == self._MENU_ITEM:
+                sub_items = [(sub_kind, sub_item, sub_is_enabled and is_enabled, sub_on_item_click)
+                             for sub_kind, sub_item, sub_is_enabled, sub_on_item_click in item._items()]
+                stack.extend(reversed(sub_items))
             else:
-                text.on_mouse_enter = self._on_mouse_enter_disabled_item
-                text.on_mouse_leave = self._on_mouse_leave_disabled_item
-                self._set_disabled_color(text)
+                self._append_text(kind, item, is_enabled, on_item_click)
+
+    def _append_text(self, kind, item, is_enabled, on_item_click):
+        text = self._create_text(label=item)
+        if kind != self._SEPARATOR_ITEM:
+            self._return_items[text] = item
+        if kind != self._SEPARATOR_ITEM and is_enabled:
+            if on_item_click is not None:
+                self._on_item_clicks[text] = on_item_click
+            text.on_left_down = self._on_item_click
+            text.on_right_down = self._on_item_click
+            text.on_mouse_enter = self._on_mouse_enter_item
+            text.on_mouse_leave = self._on_mouse_leave_item
+            self._set_normal_color(text)
+        else:
+            text.on_mouse_enter = self._on_mouse_enter_disabled_item
+            text.on_mouse_leave = self._on_mouse_leave_disabled_item
+            self._set_disabled_color(text)
 
     def _set_normal_color(self, text):
-        text.foreground_color = self._FOREGROUND_NORMAL_COLOR
-        text.background_color = self._BACKGROUND_NORMAL_COLOR
+        text.set_colors(*self._normal_colors)
 
     def _set_highlight_color(self, text):
-        text.foreground_color = self._FOREGROUND_HIGHLIGHT_COLOR
-        text.background_color = self._BACKGROUND_HIGHLIGHT_COLOR
+        text.set_colors(*self._highlight_colors)
 
     def _set_disabled_color(self, text):
-        text.foreground_color = self._FOREGROUND_DISABLED_COLOR
-        text.background_color = self._BACKGROUND_DISABLED_COLOR
+        text.set_colors(*self._disabled_colors)
 
     def _on_mouse_enter_item(self, obj):
-        self._mouse_inside[obj] = True
+        # Repeated enter or leave events of the same item are ignored
+        if obj in self._mouse_inside:
+            return
+        self._mouse_inside.add(obj)
         self._set_highlight_color(obj)
-        self._on_mouse_enter(self)
+        self._schedule_mouse_flush()
 
     def _on_mouse_leave_item(self, obj):
-        self._mouse_inside[obj] = False
+        if obj not in self._mouse_inside:
+            return
+        self._mouse_inside.discard(obj)
         self._set_normal_color(obj)
-        if not self._mouse_inside_widget():
-            self._on_mouse_leave(self)
+        self._schedule_mouse_flush()
 
     def _on_mouse_enter_disabled_item(self, obj):
-        self._mouse_inside[obj] = True
-        self._on_mouse_enter(self)
+        if obj in self._mouse_inside:
+            return
+        self._mouse_inside.add(obj)
+        self._schedule_mouse_flush()
 
     def _on_mouse_leave_disabled_item(self, obj):
-        self._mouse_inside[obj] = False
-        if not self._mouse_inside_widget():
-            self._on_mouse_leave(self)
+        if obj not in self._mouse_inside:
+            return
+        self._mouse_inside.discard(obj)
+        self._schedule_mouse_flush()
+
+    def _schedule_mouse_flush(self):
+        if not self._mouse_flush_pending:
+            self._mouse_flush_pending = True
+            self._mouse_flush_call = self._call_after(self._flush_mouse_transition)
+
+    def _flush_mouse_transition(self):
+        # Only the net change since the last flush reaches the menu
+        self._mouse_flush_pending = False
+        self._mouse_flush_call = None
+        if self._closed:
+            return
+        is_inside = self._mouse_inside_widget()
+        if is_inside != self._mouse_was_inside:
+            self._mouse_was_inside = is_inside
+            if is_inside:
+                self._on_mouse_enter(self)
+            else:
+                self._on_mouse_leave(self)
 
     def _on_item_click(self, obj, position):
         self._close()
-        self.on_click(self, obj)
+        on_item_click = self._on_item_clicks.get(obj)
+        if on_item_click is not None:
+            on_item_click()
+        else:
+            self.on_click(self, obj)
 
     def _mouse_inside_widget(self):
-        return any(self._mouse_inside.values())
+        return bool(self._mouse_inside)
@@ -2,9 +2,28 @@ import PySide6
 import PySide6.QtWidgets
 import PySide6.QtCore
 import PySide6.QtGui
+from functools import lru_cache
 
 from ..abstract.frames import AbstractIconFrame, FrameStyle, CursorStyle, AbstractDialog, AbstractMessageDialog
 
+# Window flags set and cleared for each frame style
+_FIXED_SIZE_SET_FLAGS = PySide6.QtCore.Qt.CustomizeWindowHint \
+    | PySide6.QtCore.Qt.WindowMinimizeButtonHint \
+    | PySide6.QtCore.Qt.WindowCloseButtonHint
+_FIXED_SIZE_CLEARED_FLAGS = PySide6.QtCore.Qt.WindowMaximizeButtonHint
+_DIALOG_SET_FLAGS = PySide6.QtCore.Qt.CustomizeWindowHint
+_DIALOG_CLEARED_FLAGS = PySide6.QtCore.Qt.WindowMinimizeButtonHint \
+    | PySide6.QtCore.Qt.WindowMaximizeButtonHint \
+    | PySide6.QtCore.Qt.WindowCloseButtonHint
+_CONTEXT_HELP_FLAG = PySide6.QtCore.Qt.WindowContextHelpButtonHint
+_SIZING_CURSOR = PySide6.QtCore.Qt.SizeAllCursor
+_ARROW_CURSOR = PySide6.QtCore.Qt.ArrowCursor
+
+
+@lru_cache(maxsize=32)
+def _load_icon(path):
+    return PySide6.QtGui.QIcon(path)
+
 
 class Frame(AbstractIconFrame, PySide6.QtWidgets.QMainWindow):
 
@@ -14,16 +33,9 @@ class Frame(AbstractIconFrame, PySide6.QtWidgets.QMainWindow):
 
         if self._STYLE is FrameStyle.FIXED_SIZE:
             self.layout().setSizeConstraint(PySide6.QtWidgets.QLayout.SetFixedSize)
-            self.setWindowFlags(self.windowFlags() | PySide6.QtCore.Qt.CustomizeWindowHint)
-            self.setWindowFlags(self.windowFlags() | PySide6.QtCore.Qt.WindowMinimizeButtonHint)
-            self.setWindowFlags(self.windowFlags() & ~PySide6.QtCore.Qt.WindowMaximizeButtonHint)
-            self.setWindowFlags(self.windowFlags() | PySide6.QtCore.Qt.WindowCloseButtonHint)
+            self.setWindowFlags((self.windowFlags() | _FIXED_SIZE_SET_FLAGS) & ~_FIXED_SIZE_CLEARED_FLAGS)
         elif self._STYLE is FrameStyle.DIALOG:
-            self.setWindowFlags(self.windowFlags() | PySide6.QtCore.Qt.CustomizeWindowHint)
-            self.setWindowFlags(self.windowFlags()
-                                & ~PySide6.QtCore.Qt.WindowMinimizeButtonHint
-                                & ~PySide6.QtCore.Qt.WindowMaximizeButtonHint
-                                & ~PySide6.QtCore.Qt.WindowCloseButtonHint)
+            self.setWindowFlags((self.windowFlags() | _DIALOG_SET_FLAGS) & ~_DIALOG_CLEARED_FLAGS)
 
         if size is not None:
             self.resize(*size)
@@ -33,6 +45,7 @@ class Frame(AbstractIconFrame, PySide6.QtWidgets.QMainWindow):
 
         super().__init__(parent=parent, **kwargs)
         self._size = size
+        self._pending_cursor = None
         self._panel = self
         self._create_widgets(self._panel)
 
@@ -49,7 +62,8 @@ class Frame(AbstractIconFrame, PySide6.QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         self.detach()
-        for child in self.child_views:
+        # Each child detaches itself from child_views while closing
+        for child in list(self.child_views):
             child.close()
         self.on_close(self)
         super().closeEvent(event)
@@ -63,23 +77,22 @@ class Frame(AbstractIconFrame, PySide6.QtWidgets.QMainWindow):
 
     @property
     def title(self):
-        return super(Frame, Frame).title.__get__(self)
+        return self._title
 
     @title.setter
     def title(self, title):
-        super(Frame, Frame).title.__set__(self, title)
+        self._title = title
         self.setWindowTitle(title)
 
     @property
     def icon(self):
-        return super(Frame, Frame).icon.__get__(self)
+        return self._icon
 
     @icon.setter
     def icon(self, icon):
-        super(Frame, Frame).icon.__set__(self, icon)
+        self._icon = icon
         if self.icon is not None:
-            app_icon = PySide6.QtGui.QIcon(self.icon)
-            self.setWindowIcon(app_icon)
+            self.setWindowIcon(_load_icon(self.icon))
 
     def show(self):
         PySide6.QtWidgets.QMainWindow.show(self)
@@ -93,15 +106,32 @@ class Frame(AbstractIconFrame, PySide6.QtWidgets.QMainWindow):
         menubar.clear()
         menu.build_menu(menubar=menubar)
 
+    def update_gui(self, data):
+        # Repainted once, after all the widgets have been updated
+        self.setUpdatesEnabled(False)
+        try:
+            super().update_gui(data)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+
     def _fit_frame(self):
         #
         pass
 
     def _set_cursor(self, cursor):
+        # Only the last cursor requested before the event loop runs again is applied
+        if self._pending_cursor is None:
+            PySide6.QtCore.QTimer.singleShot(0, self._apply_cursor)
+        self._pending_cursor = cursor
+
+    def _apply_cursor(self):
+        cursor = self._pending_cursor
+        self._pending_cursor = None
         if cursor is CursorStyle.SIZING:
-            PySide6.QtGui.QGuiApplication.setOverrideCursor(PySide6.QtCore.Qt.SizeAllCursor)
+            PySide6.QtGui.QGuiApplication.setOverrideCursor(_SIZING_CURSOR)
         elif cursor is CursorStyle.ARROW:
-            PySide6.QtGui.QGuiApplication.setOverrideCursor(PySide6.QtCore.Qt.ArrowCursor)
+            PySide6.QtGui.QGuiApplication.setOverrideCursor(_ARROW_CURSOR)
 
     def set_focus(self):
         self.activateWindow()
@@ -112,7 +142,7 @@ class Dialog(AbstractDialog, PySide6.QtWidgets.QDialog):
     def __init__(self, parent, **kwargs):
         PySide6.QtWidgets.QDialog.__init__(self, parent)
         super().__init__(**kwargs)
-        self.setWindowFlags(self.windowFlags() & ~PySide6.QtGui.Qt.WindowContextHelpButtonHint)
+        self.setWindowFlags(self.windowFlags() & ~_CONTEXT_HELP_FLAG)
         self._create_widgets(self)
         self._create_gui().create_layout(self)
 
@@ -124,11 +154,11 @@ class Dialog(AbstractDialog, PySide6.QtWidgets.QDialog):
 
     @property
     def title(self):
-        return super(Dialog, Dialog).title.__get__(self)
+        return self._title
 
     @title.setter
     def title(self, title):
-        super(Dialog, Dialog).title.__set__(self, title)
+        self._title = title
         self.setWindowTitle(title)
 
     def show_modal(self):
@@ -161,20 +191,20 @@ class MessageDialog(AbstractMessageDialog, PySide6.QtWidgets.QMessageBox):
 
     @property
     def title(self):
-        return super(MessageDialog, MessageDialog).title.__get__(self)
+        return self._title
 
     @title.setter
     def title(self, title):
-        super(MessageDialog, MessageDialog).title.__set__(self, title)
+        self._title = title
         self.setWindowTitle(title)
 
     @property
     def message(self):
-        return super(MessageDialog, MessageDialog).message.__get__(self)
+        return self._message
 
     @message.setter
     def message(self, message):
-        super(MessageDialog, MessageDialog).message.__set__(self, message)
+        self._message = message
         self.setText(message)
 
     def show_modal(self):
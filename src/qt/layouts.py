@@ -3,24 +3,36 @@ import PySide6.QtWidgets
 import PySide6.QtCore
 import PySide6.QtGui
 
-from ..abstract.layouts import AbstractBoxLayout, AbstractGridLayout, Align
+from ..abstract.layouts import AbstractBoxLayout, AbstractGridLayout, \
+    LEFT_MASK, HCENTER_MASK, RIGHT_MASK, TOP_MASK, VCENTER_MASK, BOTTOM_MASK, \
+    START_MASK, CENTER_MASK, END_MASK, EXPAND_MASK, NO_STRETCH
+
+_ALIGN_LEFT = PySide6.QtCore.Qt.AlignLeft
+_ALIGN_HCENTER = PySide6.QtCore.Qt.AlignHCenter
+_ALIGN_RIGHT = PySide6.QtCore.Qt.AlignRight
+_ALIGN_TOP = PySide6.QtCore.Qt.AlignTop
+_ALIGN_VCENTER = PySide6.QtCore.Qt.AlignVCenter
+_ALIGN_BOTTOM = PySide6.QtCore.Qt.AlignBottom
+_MINIMUM_EXPANDING = PySide6.QtWidgets.QSizePolicy.Policy.MinimumExpanding
 
 
 class Layout:
+    __slots__ = ()
 
     def create_layout(self, parent):
         raise NotImplementedError()
 
     def apply_align(self, align, size_policy):
         align_flag = 0
-        if align & Align.EXPAND:
+        if align & EXPAND_MASK:
             align_flag = -1
             if size_policy is not None:
-                size_policy.setHorizontalPolicy(PySide6.QtWidgets.QSizePolicy.Policy.MinimumExpanding)
+                size_policy.setHorizontalPolicy(_MINIMUM_EXPANDING)
         return align_flag
 
 
 class BoxLayout(AbstractBoxLayout, Layout):
+    __slots__ = ()
     _LAYOUT_CLASS = None
     _BEFORE = None
     _AFTER = None
@@ -31,42 +43,44 @@ class BoxLayout(AbstractBoxLayout, Layout):
     def create_layout(self, parent):
         layout = self._LAYOUT_CLASS()
         layout.setSpacing(0)
-        for widget_dict in self._widgets:
-            widget = widget_dict['type']
-            if widget == 'space':
-                layout.addSpacing(widget_dict['space'])
-            elif widget == 'stretch':
-                layout.addStretch(widget_dict['stretch'])
+        for kind, widget, widget_align, widget_border, widget_stretch, space in self.items():
+            if kind == 'space':
+                layout.addSpacing(space)
+            elif kind == 'stretch':
+                layout.addStretch(widget_stretch)
             else:
-                widget_border = widget_dict['border']
-                if isinstance(widget_border, int):
-                    widget_border = [widget_border] * 4
-
-                widget_align = widget_dict['align']
                 if isinstance(widget, Layout):
                     widget_layout = widget.create_layout(None)
                     widget_layout.setContentsMargins(widget_border[3], widget_border[0], widget_border[1], widget_border[2])
                     align_layout = self._ORTO_LAYOUT_CLASS()
-                    if widget_align & Align.END or widget_align & Align.CENTER:
+                    if widget_align & END_MASK or widget_align & CENTER_MASK:
                         align_layout.addStretch()
                     align_layout.addLayout(widget_layout)
-                    if widget_align & Align.START or widget_align & Align.CENTER:
+                    if widget_align & START_MASK or widget_align & CENTER_MASK:
                         align_layout.addStretch()
-                    layout.addLayout(align_layout, stretch=widget_dict['stretch'])
+                    layout.addLayout(align_layout, stretch=widget_stretch)
                 else:
                     widget_size_policy = widget.sizePolicy()
                     align_flag = self.apply_align(widget_align, widget_size_policy)
                     widget.setSizePolicy(widget_size_policy)
-                    layout.addSpacing(widget_border[self._BEFORE])
-                    border_layout = self._ORTO_LAYOUT_CLASS()
-                    border_layout.addSpacing(widget_border[self._ORTO_BEFORE])
-                    if align_flag == -1:
-                        border_layout.addWidget(widget, stretch=widget_dict['stretch'])
+                    if widget_border[self._BEFORE]:
+                        layout.addSpacing(widget_border[self._BEFORE])
+                    if widget_border[self._ORTO_BEFORE] or widget_border[self._ORTO_AFTER]:
+                        border_layout = self._ORTO_LAYOUT_CLASS()
+                        border_layout.addSpacing(widget_border[self._ORTO_BEFORE])
+                        if align_flag == -1:
+                            border_layout.addWidget(widget, stretch=widget_stretch)
+                        else:
+                            border_layout.addWidget(widget, alignment=align_flag, stretch=widget_stretch)
+                        border_layout.addSpacing(widget_border[self._ORTO_AFTER])
+                        layout.addLayout(border_layout, stretch=widget_stretch)
+                    elif align_flag == -1:
+                        # Without orthogonal borders the widget goes straight into the layout
+                        layout.addWidget(widget, stretch=widget_stretch)
                     else:
-                        border_layout.addWidget(widget, alignment=align_flag, stretch=widget_dict['stretch'])
-                    border_layout.addSpacing(widget_border[self._ORTO_AFTER])
-                    layout.addLayout(border_layout, stretch=widget_dict['stretch'])
-                    layout.addSpacing(widget_border[self._AFTER])
+                        layout.addWidget(widget, alignment=align_flag, stretch=widget_stretch)
+                    if widget_border[self._AFTER]:
+                        layout.addSpacing(widget_border[self._AFTER])
         if parent is not None:
             parent.setLayout(layout)
 
@@ -74,6 +88,7 @@ class BoxLayout(AbstractBoxLayout, Layout):
 
 
 class VBoxLayout(BoxLayout):
+    __slots__ = ()
     _LAYOUT_CLASS = PySide6.QtWidgets.QVBoxLayout
     _BEFORE = 0
     _AFTER = 2
@@ -84,16 +99,17 @@ class VBoxLayout(BoxLayout):
     def apply_align(self, align, size_policy):
         align_flag = super().apply_align(align, size_policy)
         if align_flag == 0:
-            if align & Align.LEFT:
-                align_flag = PySide6.QtCore.Qt.AlignLeft
-            elif align & Align.HCENTER:
-                align_flag = PySide6.QtCore.Qt.AlignHCenter
-            elif align & Align.RIGHT:
-                align_flag = PySide6.QtCore.Qt.AlignRight
+            if align & LEFT_MASK:
+                align_flag = _ALIGN_LEFT
+            elif align & HCENTER_MASK:
+                align_flag = _ALIGN_HCENTER
+            elif align & RIGHT_MASK:
+                align_flag = _ALIGN_RIGHT
         return align_flag
 
 
 class HBoxLayout(BoxLayout):
+    __slots__ = ()
     _LAYOUT_CLASS = PySide6.QtWidgets.QHBoxLayout
     _BEFORE = 3
     _AFTER = 1
@@ -104,16 +120,17 @@ class HBoxLayout(BoxLayout):
     def apply_align(self, align, size_policy):
         align_flag = super().apply_align(align, size_policy)
         if align_flag == 0:
-            if align & Align.TOP:
-                align_flag = PySide6.QtCore.Qt.AlignTop
-            elif align & Align.VCENTER:
-                align_flag = PySide6.QtCore.Qt.AlignVCenter
-            elif align & Align.BOTTOM:
-                align_flag = PySide6.QtCore.Qt.AlignBottom
+            if align & TOP_MASK:
+                align_flag = _ALIGN_TOP
+            elif align & VCENTER_MASK:
+                align_flag = _ALIGN_VCENTER
+            elif align & BOTTOM_MASK:
+                align_flag = _ALIGN_BOTTOM
         return align_flag
 
 
 class GridLayout(AbstractGridLayout, Layout):
+    __slots__ = ()
 
     def create_layout(self, parent):
         layout = PySide6.QtWidgets.QGridLayout()
@@ -121,11 +138,11 @@ class GridLayout(AbstractGridLayout, Layout):
         layout.setVerticalSpacing(self._vgap)
 
         for row in range(self._rows):
-            if self._row_stretch[row] is not None:
+            if self._row_stretch[row] != NO_STRETCH:
                 layout.setRowStretch(row, self._row_stretch[row])
 
         for col in range(self._cols):
-            if self._col_stretch[col] is not None:
+            if self._col_stretch[col] != NO_STRETCH:
                 layout.setColumnStretch(col, self._col_stretch[col])
 
         for row, widgets_row in enumerate(self._widgets):
@@ -137,8 +154,6 @@ class GridLayout(AbstractGridLayout, Layout):
                     layout.addItem(PySide6.QtWidgets.QSpacerItem(widget_dict['width'], widget_dict['height']), row, col)
                 else:
                     widget_border = widget_dict['border']
-                    if isinstance(widget_border, int):
-                        widget_border = [widget_border] * 4
                     widget_align = widget_dict['align']
 
                     if isinstance(widget, Layout):
@@ -153,6 +168,11 @@ class GridLayout(AbstractGridLayout, Layout):
                         align_flag = self.apply_align(widget_align, widget_size_policy)
                         widget.setSizePolicy(widget_size_policy)
 
+                        if not any(widget_border):
+                            # Without borders the widget goes straight into the cell
+                            layout.addWidget(widget, row, col, alignment=0 if align_flag == -1 else align_flag)
+                            continue
+
                         border_layout = PySide6.QtWidgets.QGridLayout()
                         border_layout.setHorizontalSpacing(0)
                         border_layout.setVerticalSpacing(0)
@@ -169,16 +189,16 @@ class GridLayout(AbstractGridLayout, Layout):
     def apply_align(self, align, size_policy):
         align_flag = super().apply_align(align, size_policy)
         if align_flag == 0:
-            if align & Align.TOP:
-                align_flag = PySide6.QtCore.Qt.AlignTop
-            elif align & Align.VCENTER:
-                align_flag = PySide6.QtCore.Qt.AlignVCenter
-            elif align & Align.BOTTOM:
-                align_flag = PySide6.QtCore.Qt.AlignBottom
-            if align & Align.LEFT:
-                align_flag |= PySide6.QtCore.Qt.AlignLeft
-            elif align & Align.HCENTER:
-                align_flag |= PySide6.QtCore.Qt.AlignHCenter
-            elif align & Align.RIGHT:
-                align_flag |= PySide6.QtCore.Qt.AlignRight
+            if align & TOP_MASK:
+                align_flag = _ALIGN_TOP
+            elif align & VCENTER_MASK:
+                align_flag = _ALIGN_VCENTER
+            elif align & BOTTOM_MASK:
+                align_flag = _ALIGN_BOTTOM
+            if align & LEFT_MASK:
+                align_flag |= _ALIGN_LEFT
+            elif align & HCENTER_MASK:
+                align_flag |= _ALIGN_HCENTER
+            elif align & RIGHT_MASK:
+                align_flag |= _ALIGN_RIGHT
         return align_flag
@@ -1,6 +1,7 @@
 import PySide6.QtWidgets
 import PySide6.QtCore
 import PySide6.QtGui
+from functools import lru_cache
 
 from ..abstract.tables import Align, TextStyle, Renderer, AbstractGrid
 from .widgets import Widget, rgb2hex
@@ -8,6 +9,21 @@ from .widgets import Widget, rgb2hex
 _UNCHECKED_BOX_SYMBOL = '\u2610'
 _CHECKED_BOX_SYMBOL = '\u2611'
 
+# Position of the value returned for each role in the cached cell tuples
+_ROLE_INDEXES = {
+    int(PySide6.QtCore.Qt.DisplayRole): 0,
+    int(PySide6.QtCore.Qt.FontRole): 1,
+    int(PySide6.QtCore.Qt.ForegroundRole): 2,
+    int(PySide6.QtCore.Qt.BackgroundRole): 3,
+    int(PySide6.QtCore.Qt.TextAlignmentRole): 4,
+}
+_RENDERER_INDEX = 5
+
+
+@lru_cache(maxsize=None)
+def _qcolor(*rgb):
+    return PySide6.QtGui.QColor.fromRgb(*rgb)
+
 
 class GridTable(PySide6.QtCore.QAbstractTableModel):
     pass
@@ -41,6 +57,8 @@ class TableHeader(PySide6.QtWidgets.QHeaderView):
 
 
 class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
+    _font_dicts = {}
+    _stylesheets = {}
 
     def __init__(self, panel):
         PySide6.QtWidgets.QTableView.__init__(self, panel)
@@ -48,34 +66,32 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
         self.setHorizontalHeader(TableHeader(PySide6.QtGui.Qt.Horizontal, self))
         self.setVerticalHeader(TableHeader(PySide6.QtGui.Qt.Vertical, self))
 
-        self._qt_font = PySide6.QtGui.QFont('Helvetica', self._FONT_SIZE)
-        self._qt_font_bold = PySide6.QtGui.QFont('Helvetica', self._FONT_SIZE)
-        self._qt_font_bold.setBold(True)
-        self._qt_font_italic = PySide6.QtGui.QFont('Helvetica', self._FONT_SIZE)
-        self._qt_font_italic.setItalic(True)
-        self._qt_font_bold_italic = PySide6.QtGui.QFont('Helvetica', self._FONT_SIZE)
-        self._qt_font_bold_italic.setBold(True)
-        self._qt_font_bold_italic.setItalic(True)
-
-        self._font_dict = {
-            TextStyle.NORMAL: self._qt_font,
-            TextStyle.BOLD: self._qt_font_bold,
-            TextStyle.ITALIC: self._qt_font_italic,
-            TextStyle.BOLD_ITALIC: self._qt_font_bold_italic
-        }
+        # Fonts and stylesheets are shared by all the grids with the same size and header colour
+        font_dict = Grid._font_dicts.get(self._FONT_SIZE)
+        if font_dict is None:
+            font_dict = Grid._font_dicts[self._FONT_SIZE] = self._create_font_dict(self._FONT_SIZE)
+        self._font_dict = font_dict
+        self._qt_font_bold = font_dict[TextStyle.BOLD]
 
         self._align_dict = {
             Align.LEFT: int(PySide6.QtCore.Qt.AlignLeft | PySide6.QtCore.Qt.AlignVCenter),
             Align.CENTER: int(PySide6.QtCore.Qt.AlignCenter),
             Align.RIGHT: int(PySide6.QtCore.Qt.AlignRight | PySide6.QtCore.Qt.AlignVCenter),
         }
+        # Qt values of the cells, valid until the next refresh
+        self._qt_cell_cache = {}
+        self._batch_depth = 0
         self._grid_table = self._get_grid_table()
 
         color_string = rgb2hex(*self._get_header_colour()[1])
-        header_stylesheet = "::section{Background-color : %s}" % color_string
+        stylesheets = Grid._stylesheets.get(color_string)
+        if stylesheets is None:
+            stylesheets = Grid._stylesheets[color_string] = (
+                "::section{Background-color : %s}" % color_string,
+                "QTableCornerButton::section{Background-color : %s}" % color_string)
+        header_stylesheet, corner_stylesheet = stylesheets
         self.horizontalHeader().setStyleSheet(header_stylesheet)
         self.verticalHeader().setStyleSheet(header_stylesheet)
-        corner_stylesheet = "QTableCornerButton::section{Background-color : %s}" % color_string
         self.setStyleSheet(corner_stylesheet)
         self.setCornerButtonEnabled(False)
 
@@ -86,6 +102,16 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
         self.setFocusPolicy(PySide6.QtCore.Qt.NoFocus)
         self.setSizePolicy(PySide6.QtWidgets.QSizePolicy.Minimum, PySide6.QtWidgets.QSizePolicy.Minimum)
 
+    @staticmethod
+    def _create_font_dict(font_size):
+        font_dict = {}
+        for style in TextStyle:
+            font = PySide6.QtGui.QFont('Helvetica', font_size)
+            font.setBold(style in (TextStyle.BOLD, TextStyle.BOLD_ITALIC))
+            font.setItalic(style in (TextStyle.ITALIC, TextStyle.BOLD_ITALIC))
+            font_dict[style] = font
+        return font_dict
+
     def _get_grid_table(self):
         grid_table = GridTable()
         grid_table.rowCount = self._get_row_count
@@ -95,33 +121,32 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
         return grid_table
 
     def _get_row_count(self, index):
-        return self._get_number_rows()
+        return self._shape_cache[0]
 
     def _get_column_count(self, index):
-        return self._get_number_cols()
+        return self._shape_cache[1]
+
+    def _get_qt_cell(self, row, column):
+        cell = self._qt_cell_cache.get((row, column))
+        if cell is None:
+            colour, style, align, renderer = self._cell_meta(row, column)
+            value = self._get_value(row, column)
+            if renderer is Renderer.BOOLEAN:
+                value = (_UNCHECKED_BOX_SYMBOL, _CHECKED_BOX_SYMBOL)[bool(int(value))]
+                align = Align.CENTER
+            cell = (value, self._font_dict[style], _qcolor(*colour[0]), _qcolor(*colour[1]),
+                    self._align_dict[align], renderer)
+            self._qt_cell_cache[(row, column)] = cell
+        return cell
 
     def _get_data(self, index, role):
         row = index.row()
         column = index.column()
-        renderer = self._get_renderer(row, column)
-        if role == PySide6.QtCore.Qt.DisplayRole:
-            value = self._get_value(row, column)
-            if renderer is Renderer.BOOLEAN:
-                return (_UNCHECKED_BOX_SYMBOL, _CHECKED_BOX_SYMBOL)[bool(int(value))]
-            else:
-                return value
-        elif role == PySide6.QtCore.Qt.FontRole:
-            return self._font_dict[self._get_style(row, column)]
-        elif role == PySide6.QtCore.Qt.ForegroundRole:
-            return PySide6.QtGui.QColor.fromRgb(*self._get_colour(row, column)[0])
-        elif role == PySide6.QtCore.Qt.BackgroundRole:
-            return PySide6.QtGui.QColor.fromRgb(*self._get_colour(row, column)[1])
-        elif role == PySide6.QtCore.Qt.TextAlignmentRole:
-            if renderer is Renderer.BOOLEAN:
-                return self._align_dict[Align.CENTER]
-            else:
-                return self._align_dict[self._get_align(row, column)]
-        if renderer is Renderer.AUTO_WRAP:
+        cell = self._get_qt_cell(row, column)
+        role_index = _ROLE_INDEXES.get(role)
+        if role_index is not None:
+            return cell[role_index]
+        if self._has_custom_renderer and cell[_RENDERER_INDEX] is Renderer.AUTO_WRAP:
             self._set_col_size(column, self._MAX_COL_WIDTH)
 
     def _get_header_data(self, index, orientation, role):
@@ -133,7 +158,7 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
         elif role == PySide6.QtCore.Qt.FontRole:
             return self._qt_font_bold
         elif role == PySide6.QtCore.Qt.ForegroundRole:
-            return PySide6.QtGui.QColor.fromRgb(*self._get_header_colour()[0])
+            return _qcolor(*self._get_header_colour()[0])
 
     def mousePressEvent(self, event):
         button = event.button()
@@ -160,17 +185,30 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
             self.on_cell_right_double_click(self, row, col)
 
     def refresh(self):
+        # The model and the sizes are updated with a single repaint at the end
+        self._begin_batch()
+        try:
+            self._refresh_batched()
+        finally:
+            self._end_batch()
+
+    def _refresh_batched(self):
+        horizontal_header = self.horizontalHeader()
+        vertical_header = self.verticalHeader()
+        self._cell_meta_cache.clear()
+        self._qt_cell_cache.clear()
+        self._refresh_shape()
         self.setModel(self._grid_table)
         self._grid_table.layoutChanged.emit()
 
         if self._hide_row_labels:
-            self.verticalHeader().hide()
+            vertical_header.hide()
         elif not self._auto_size_row_labels:
-            self.verticalHeader().setFixedWidth(self._ROW_LABEL_WIDTH)
+            vertical_header.setFixedWidth(self._ROW_LABEL_WIDTH)
         if self._hide_col_labels:
-            self.horizontalHeader().hide()
+            horizontal_header.hide()
         elif not self._auto_size_col_labels:
-            self.horizontalHeader().setFixedHeight(self._COL_LABEL_HEIGHT)
+            horizontal_header.setFixedHeight(self._COL_LABEL_HEIGHT)
         if self._auto_size_rows:
             self.resizeRowsToContents()
         else:
@@ -180,16 +218,16 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
         elif self._auto_size_cols:
             self.resizeColumnsToContents()
         else:
-            self._set_row_sizes(self._COL_WIDTH)
+            self._set_col_sizes(self._COL_WIDTH)
 
         height = 0
         width = 0
 
         if self._AVOID_HORIZONTAL_SCROLL:
             self.setHorizontalScrollBarPolicy(PySide6.QtGui.Qt.ScrollBarAlwaysOff)
-            width = self.horizontalHeader().length()
-            if not self.verticalHeader().isHidden():
-                width += self.verticalHeader().width()
+            width = horizontal_header.length()
+            if not vertical_header.isHidden():
+                width += vertical_header.width()
             if self._MAXIMUM_WIDTH is not None and width > self._MAXIMUM_WIDTH:
                 width = self._MAXIMUM_WIDTH
                 self.setHorizontalScrollBarPolicy(PySide6.QtGui.Qt.ScrollBarAsNeeded)
@@ -197,9 +235,9 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
 
         if self._AVOID_VERTICAL_SCROLL:
             self.setVerticalScrollBarPolicy(PySide6.QtGui.Qt.ScrollBarAlwaysOff)
-            height = self.verticalHeader().length()
-            if not self.horizontalHeader().isHidden():
-                height += self.horizontalHeader().height()
+            height = vertical_header.length()
+            if not horizontal_header.isHidden():
+                height += horizontal_header.height()
             if self._MAXIMUM_HEIGHT is not None and height > self._MAXIMUM_HEIGHT:
                 height = self._MAXIMUM_HEIGHT
                 self.setVerticalScrollBarPolicy(PySide6.QtGui.Qt.ScrollBarAsNeeded)
@@ -228,12 +266,21 @@ class Grid(AbstractGrid, Widget, PySide6.QtWidgets.QTableView):
         self.setRowHeight(row, size)
 
     def _set_row_sizes(self, size):
-        self.verticalHeader().setSectionResizeMode(self.verticalHeader().ResizeMode.Fixed)
         self.verticalHeader().setDefaultSectionSize(size)
 
     def _set_col_size(self, col, size):
         self.setColumnWidth(col, size)
 
+    def _begin_batch(self):
+        # Batches can be nested, the updates are enabled again by the outermost one
+        if not self._batch_depth:
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+
+    def _end_batch(self):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.setUpdatesEnabled(True)
+
     def _set_col_sizes(self, size):
-        self.horizontalHeader().setSectionResizeMode(self.horizontalHeader().ResizeMode.Fixed)
         self.horizontalHeader().setDefaultSectionSize(size)
@@ -10,6 +10,17 @@ from ..abstract.widgets import AbstractWidget, AbstractMouseEventsWidget, Abstra
     AbstractText, AbstractCalendar, AbstractSpinControl, AbstractMenu, TextStyle, AbstractTextTimedMenu
 
 
+_CALENDAR_LOCALES = {
+    'English': PySide6.QtCore.QLocale.English,
+    'Italiano': PySide6.QtCore.QLocale.Italian,
+    'Deutsch': PySide6.QtCore.QLocale.German
+}
+
+
+def _ignore_event(event):
+    pass
+
+
 def build_font(size, style):
     font = PySide6.QtGui.QFont('Helvetica', size)
     if style is TextStyle.BOLD:
@@ -243,6 +254,9 @@ class TextWidget(AbstractText):
         super(TextWidget, TextWidget).background_color.__set__(self, background_color)
         self._set_style_sheet()
 
+    def _apply_colors(self):
+        self._set_style_sheet()
+
     def _set_style_sheet(self):
         if self.foreground_color:
             color_string = rgb2hex(*self.foreground_color)
@@ -350,14 +364,7 @@ class Calendar(AbstractCalendar, Widget, PySide6.QtWidgets.QCalendarWidget):
         self.setSelectedDate(PySide6.QtCore.QDate(date_as_tuple[0], date_as_tuple[1], date_as_tuple[2]))
 
     def set_language(self, language):
-        if language == 'English':
-            self.setLocale(PySide6.QtCore.QLocale.English)
-        elif language == 'Italiano':
-            self.setLocale(PySide6.QtCore.QLocale.Italian)
-        elif language == 'Deutsch':
-            self.setLocale(PySide6.QtCore.QLocale.German)
-        else:
-            self.setLocale(PySide6.QtCore.QLocale.English)
+        self.setLocale(_CALENDAR_LOCALES.get(language, PySide6.QtCore.QLocale.English))
 
 
 class SpinControl(AbstractSpinControl, Widget, PySide6.QtWidgets.QSpinBox):
@@ -416,10 +423,10 @@ class Menu(AbstractMenu, Widget, PySide6.QtWidgets.QMenu):
         super().pop_up()
         self.exec(PySide6.QtGui.QCursor.pos())
 
-    def _append_menubar(self, menubar, item, is_enabled, on_item_click):
-        if item is None:
+    def _append_menubar(self, menubar, kind, item, is_enabled, on_item_click):
+        if kind == self._SEPARATOR_ITEM:
             return
-        elif isinstance(item, Menu):
+        elif kind == self._MENU_ITEM:
             item.build_menu(inherited_on_click=self.on_click)
             item.setTitle(item.label)
             menubar.addMenu(item)
@@ -438,10 +445,10 @@ class Menu(AbstractMenu, Widget, PySide6.QtWidgets.QMenu):
             self._return_items[entry] = item
         entry.setEnabled(is_enabled)
 
-    def _append_menu(self, item, is_enabled, on_item_click):
-        if item == self.SEPARATOR:
+    def _append_menu(self, kind, item, is_enabled, on_item_click):
+        if kind == self._SEPARATOR_ITEM:
             entry = self.addSeparator()
-        elif isinstance(item, Menu):
+        elif kind == self._MENU_ITEM:
             item.build_menu(inherited_on_click=self.on_click)
             item.setTitle(item.label)
             self.addMenu(item)
@@ -498,10 +505,29 @@ class TextTimedMenu(AbstractTextTimedMenu, PySide6.QtWidgets.QDialog):
         self._layout.addWidget(text)
         return text
 
+    def _call_after(self, function):
+        PySide6.QtCore.QTimer.singleShot(0, function)
+
+    def _schedule(self, delay, function):
+        timer = PySide6.QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(function)
+        timer.start(int(delay * 1000))
+        return timer
+
+    def _cancel(self, timer):
+        timer.stop()
+
+    def _begin_batch(self):
+        self.setUpdatesEnabled(False)
+
+    def _end_batch(self):
+        self.setUpdatesEnabled(True)
+
     def _close(self):
         super()._close()
-        for text in self._texts:
-            text.leaveEvent = lambda event: None
+        for text in self._return_items:
+            text.leaveEvent = _ignore_event
         self._close_signal.emit()
 
     def _on_close_signal(self):
@@ -94,7 +94,8 @@ class Frame(AbstractIconFrame):
     def _on_close(self):
         self._toplevel.destroy()
         self.detach()
-        for child in self.child_views:
+        # Each child detaches itself from child_views while closing
+        for child in list(self.child_views):
             child.close()
         self.on_close(self)
         if self.parent is None:
@@ -1,10 +1,12 @@
 import tkinter
 
-from ..abstract.layouts import AbstractBoxLayout, AbstractGridLayout, Align
+from ..abstract.layouts import AbstractBoxLayout, AbstractGridLayout, \
+    LEFT_MASK, HCENTER_MASK, RIGHT_MASK, TOP_MASK, VCENTER_MASK, BOTTOM_MASK, EXPAND_MASK, NO_STRETCH
 from .tables import Grid
 
 
 class Layout:
+    __slots__ = ()
 
     def create_layout(self, parent):
         raise NotImplementedError()
@@ -18,6 +20,7 @@ class Layout:
 
 
 class BoxLayout(AbstractBoxLayout, Layout):
+    __slots__ = ('_delta_row', '_delta_col')
     _DIRECTION = None
 
     def __init__(self):
@@ -28,22 +31,16 @@ class BoxLayout(AbstractBoxLayout, Layout):
     def create_layout(self, parent):
         frame = tkinter.Frame(parent)
         frame.pack_propagate(0)
-        for index, widget_dict in enumerate(self._widgets):
-            widget = widget_dict['type']
-
-            if widget == 'space':
-                self.create_space(frame, index, widget_dict['space'])
-            elif widget == 'stretch':
-                self.create_stretch(frame, index, widget_dict['stretch'])
+        for index, (kind, widget, widget_align, widget_border, widget_stretch, space) in enumerate(self.items()):
+            if kind == 'space':
+                self.create_space(frame, index, space)
+            elif kind == 'stretch':
+                self.create_stretch(frame, index, widget_stretch)
             else:
                 row, col = self._get_row_col(index)
 
-                widget_align = widget_dict['align']
                 sticky = self.apply_align(widget_align)
 
-                widget_border = widget_dict['border']
-                if isinstance(widget_border, int):
-                    widget_border = [widget_border] * 4
                 padx, pady = self._get_border(widget_border)
                 if isinstance(widget, Layout):
                     widget = widget.create_layout(frame)
@@ -77,7 +74,6 @@ class BoxLayout(AbstractBoxLayout, Layout):
                     widget.set_frame(frame)
                     widget.grid(row=row, column=col, padx=padx, pady=pady, sticky=sticky)
 
-                widget_stretch = widget_dict['stretch']
                 self.create_stretch(frame, index, widget_stretch)
 
         return frame
@@ -93,6 +89,7 @@ class BoxLayout(AbstractBoxLayout, Layout):
 
 
 class VBoxLayout(BoxLayout):
+    __slots__ = ()
 
     def create_layout(self, parent):
         frame = super().create_layout(parent)
@@ -109,18 +106,19 @@ class VBoxLayout(BoxLayout):
         return index + self._delta_row, 0
 
     def apply_align(self, align):
-        if align & Align.EXPAND:
+        if align & EXPAND_MASK:
             return "ew"
-        elif align & Align.LEFT:
+        elif align & LEFT_MASK:
             return "w"
-        elif align & Align.HCENTER:
+        elif align & HCENTER_MASK:
             return ""
-        elif align & Align.RIGHT:
+        elif align & RIGHT_MASK:
             return "e"
         return ""
 
 
 class HBoxLayout(BoxLayout):
+    __slots__ = ()
 
     def create_layout(self, parent):
         frame = super().create_layout(parent)
@@ -137,34 +135,37 @@ class HBoxLayout(BoxLayout):
         return 0, index + self._delta_col
 
     def apply_align(self, align):
-        if align & Align.EXPAND:
+        if align & EXPAND_MASK:
             return "ns"
-        elif align & Align.TOP:
+        elif align & TOP_MASK:
             return "n"
-        elif align & Align.VCENTER:
+        elif align & VCENTER_MASK:
             return ""
-        elif align & Align.BOTTOM:
+        elif align & BOTTOM_MASK:
             return "s"
         return ""
 
 
 class GridLayout(AbstractGridLayout, Layout):
+    __slots__ = ()
 
     def create_layout(self, parent):
         frame = tkinter.Frame(parent)
 
         for row in range(self._rows):
-            if self._row_stretch[row] is not None:
+            if self._row_stretch[row] != NO_STRETCH:
                 frame.grid_rowconfigure(row, weight=self._row_stretch[row])
 
         for col in range(self._cols):
-            if self._row_stretch[col] is not None:
+            if self._col_stretch[col] != NO_STRETCH:
                 frame.grid_columnconfigure(col, weight=self._col_stretch[col])
 
         for row, widgets_row in enumerate(self._widgets):
             for col, widget_dict in enumerate(widgets_row):
                 widget = widget_dict['type']
-                if widget == 'space':
+                if widget is None:
+                    continue
+                elif widget == 'space':
                     frame.grid_rowconfigure(row, minsize=widget_dict['height'])
                     frame.grid_columnconfigure(col, minsize=widget_dict['width'])
                 else:
@@ -177,8 +178,6 @@ class GridLayout(AbstractGridLayout, Layout):
                         widget.set_frame(frame)
 
                     widget_border = widget_dict['border']
-                    if isinstance(widget_border, int):
-                        widget_border = [widget_border] * 4
                     padx, pady = self._get_border(widget_border)
 
                     if row != 0:
@@ -194,16 +193,16 @@ class GridLayout(AbstractGridLayout, Layout):
         return frame
 
     def apply_align(self, align):
-        if align & Align.EXPAND:
+        if align & EXPAND_MASK:
             return "nsew"
         else:
             sticky=""
-            if align & Align.TOP:
+            if align & TOP_MASK:
                 sticky += "n"
-            elif align & Align.BOTTOM:
+            elif align & BOTTOM_MASK:
                 sticky += "s"
-            if align & Align.LEFT:
+            if align & LEFT_MASK:
                 sticky += "w"
-            elif align & Align.RIGHT:
+            elif align & RIGHT_MASK:
                 sticky += "e"
             return sticky
@@ -1,6 +1,7 @@
 import tkinter
 import tkinter.ttk
 import tkinter.font
+from functools import lru_cache
 
 from ..abstract.tables import Align, TextStyle, Renderer, AbstractGrid
 from .widgets import Widget
@@ -9,7 +10,14 @@ from ..tk import ttk_style
 _UNCHECKED_BOX_SYMBOL = '\u2610'
 _CHECKED_BOX_SYMBOL = '\u2611'
 
+_ANCHORS = {
+    Align.LEFT: tkinter.W,
+    Align.CENTER: tkinter.CENTER,
+    Align.RIGHT: tkinter.E
+}
 
+
+@lru_cache(maxsize=None)
 def rgb2hex(r, g, b, *args):
     return "#{:02x}{:02x}{:02x}".format(r, g, b)
 
@@ -53,6 +61,13 @@ class Grid(AbstractGrid, Widget):
         self._tk_font_italic = (self._FONT_FAMILY, self._FONT_SIZE, 'italic')
         self._tk_font_bold_italic = (self._FONT_FAMILY, self._FONT_SIZE, 'bold italic')
 
+        self._font_dict = {
+            TextStyle.NORMAL: self._tk_font,
+            TextStyle.BOLD: self._tk_font_bold,
+            TextStyle.ITALIC: self._tk_font_italic,
+            TextStyle.BOLD_ITALIC: self._tk_font_bold_italic
+        }
+
         ttk_style.element_create(str(id(self)) + '.Treeheading.border', 'from', 'default')
         ttk_style.layout(
             str(id(self)) + '.Treeview.Heading', [
@@ -185,7 +200,7 @@ class Grid(AbstractGrid, Widget):
             if not self._AVOID_VERTICAL_SCROLL:
                 grid_params_ysb = self.ysb.grid_info()
                 self.ysb.grid_forget()
-            row_numbers = min(self._get_number_rows(), self._GRID_ROW_NUMBERS)
+            row_numbers = min(self._shape_cache[0], self._GRID_ROW_NUMBERS)
             self._create_widget(row_numbers)
             if grid_params:
                 self._widget.grid(**grid_params)
@@ -195,20 +210,15 @@ class Grid(AbstractGrid, Widget):
                     self.ysb.grid(**grid_params_ysb)
 
     def _refresh_columns(self):
+        number_rows, number_cols = self._shape_cache
         columns = []
-        for col in range(self._get_number_cols()):
+        for col in range(number_cols):
             columns.append(f"#{col + 1}")
         self._widget['columns'] = columns
-        for col in range(self._get_number_cols()):
-            if self._get_number_rows() > 0:
-                align = self._get_align(0, col)
-                renderer = self._get_renderer(0, col)
-                if align is Align.LEFT:
-                    anchor = tkinter.W
-                elif align is Align.RIGHT:
-                    anchor = tkinter.E
-                else:
-                    anchor = tkinter.CENTER
+        for col in range(number_cols):
+            if number_rows > 0:
+                _, _, align, renderer = self._cell_meta(0, col)
+                anchor = _ANCHORS.get(align, tkinter.CENTER)
                 if renderer is Renderer.BOOLEAN:
                     anchor = tkinter.CENTER
             else:
@@ -218,7 +228,7 @@ class Grid(AbstractGrid, Widget):
     def _refresh_col_labels(self, col_auto_width):
         if not self._hide_col_labels:
             max_label_height = 0
-            for col in range(self._get_number_cols()):
+            for col in range(self._shape_cache[1]):
                 label = self._get_col_label_value(col)
                 self._widget.heading(f"#{col + 1}", text=label)
                 max_label_height = max(max_label_height, label.count('\n'))
@@ -238,30 +248,22 @@ class Grid(AbstractGrid, Widget):
             self._widget.delete(child)
         self._row_ids.clear()
 
-        for row in range(self._get_number_rows()):
-            row_values = []
-            for col in range(self._get_number_cols()):
-                value = self._get_value(row, col)
-                renderer = self._get_renderer(row, col)
-                if renderer is Renderer.BOOLEAN:
-                    value = (_UNCHECKED_BOX_SYMBOL, _CHECKED_BOX_SYMBOL)[bool(int(value))]
-                row_values.append(value)
-                if self._auto_size_cols and not self._col_widths:
+        for row in range(self._shape_cache[0]):
+            row_values = list(self._get_row_values(row))
+            # Without a custom renderer every cell is shown as it is
+            if self._has_custom_renderer:
+                for col, value in enumerate(row_values):
+                    if self._cell_meta(row, col)[3] is Renderer.BOOLEAN:
+                        row_values[col] = (_UNCHECKED_BOX_SYMBOL, _CHECKED_BOX_SYMBOL)[bool(int(value))]
+            if self._auto_size_cols and not self._col_widths:
+                for col, value in enumerate(row_values):
                     col_auto_width[col + 1] = max(col_auto_width[col + 1], self._font_for_measure.measure(value))
 
-            foreground_color, background_color = self._get_colour(row, 0)
+            (foreground_color, background_color), text_style, _, _ = self._cell_meta(row, 0)
             fg_string = rgb2hex(*foreground_color)
             bg_string = rgb2hex(*background_color)
 
-            text_style = self._get_style(row, 0)
-            if text_style is TextStyle.BOLD:
-                font = self._tk_font_bold
-            elif text_style is TextStyle.ITALIC:
-                font = self._tk_font_italic
-            elif text_style is TextStyle.BOLD_ITALIC:
-                font = self._tk_font_bold_italic
-            else:
-                font = self._tk_font
+            font = self._font_dict.get(text_style, self._tk_font)
 
             tag = fg_string + bg_string + str(font)
             self._widget.tag_configure(tag, foreground=fg_string, background=bg_string, font=font)
@@ -272,11 +274,13 @@ class Grid(AbstractGrid, Widget):
             self._row_ids.append(row_id)
 
     def refresh(self):
+        self._cell_meta_cache.clear()
+        number_cols = self._refresh_shape()[1]
         self._refresh_row_numbers()
 
         self._refresh_columns()
 
-        col_auto_width = [0] * (self._get_number_cols() + 1)
+        col_auto_width = [0] * (number_cols + 1)
 
         self._refresh_col_labels(col_auto_width)
 
@@ -292,7 +296,7 @@ class Grid(AbstractGrid, Widget):
         if self._col_widths is not None:
             self._set_frozen_cols_width()
         elif self._auto_size_cols:
-            for col in range(self._get_number_cols()):
+            for col in range(number_cols):
                 self._set_col_size(col, min(col_auto_width[col + 1] + 10, self._MAX_COL_WIDTH))
         else:
             self._set_col_sizes(self._COL_WIDTH)
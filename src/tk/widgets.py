@@ -14,6 +14,13 @@ from ..abstract.widgets import AbstractWidget, AbstractMouseEventsWidget, Abstra
 from ..tk import ttk_style
 
 
+_CALENDAR_LOCALES = {
+    'English': 'en_UK',
+    'Italiano': 'it_IT',
+    'Deutsch': 'de_DE'
+}
+
+
 def rgb2hex(r, g, b, *args):
     return "#{:02x}{:02x}{:02x}".format(r, g, b)
 
@@ -37,8 +44,9 @@ class Widget(AbstractWidget):
         super().__init__(**kwargs)
 
     def __getattr__(self, item):
-        if '_widget' in self.__dict__ and self._widget is not None:
-            return getattr(self._widget, item)
+        widget = self.__dict__.get('_widget')
+        if widget is not None:
+            return getattr(widget, item)
         else:
             return None
 
@@ -199,7 +207,7 @@ class RadioBox(AbstractRadioBox, Widget):
             rb.pack(fill='x')
             self._rb.append(rb)
         self._var.set(super(RadioBox, RadioBox).selection.__get__(self))
-        for index in range(len(self._choices)):
+        for index in range(self._num_choices):
             self._rb[index].configure(text=self._choices[index])
         super().set_frame(frame)
 
@@ -268,7 +276,6 @@ class TextWidget(AbstractText, Widget):
             return None
 
     def set_frame(self, frame):
-        self.configure(font=build_font(self.font_size, self.font_style))
         self.configure(font=build_font(self.font_size, self.font_style))
         if self.foreground_color:
             ttk_style.configure(str(id(self)) + '.' + self._get_style_id(), foreground=rgb2hex(*self.foreground_color))
@@ -335,6 +342,20 @@ class TextWidget(AbstractText, Widget):
                 ttk_style.configure(str(id(self)) + '.' + self._get_style_id(), background=default_bg)
             self.configure(style=str(id(self)) + '.' + self._get_style_id())
 
+    def _apply_colors(self):
+        if self._widget is not None:
+            style_id = self._get_style_id()
+            if self.foreground_color:
+                foreground = rgb2hex(*self.foreground_color)
+            else:
+                foreground = ttk_style.lookup(style_id, 'foreground')
+            if self.background_color:
+                background = rgb2hex(*self.background_color)
+            else:
+                background = ttk_style.lookup(style_id, 'background')
+            ttk_style.configure(str(id(self)) + '.' + style_id, foreground=foreground, background=background)
+            self.configure(style=str(id(self)) + '.' + style_id)
+
 
 class TextControl(TextWidget):
 
@@ -420,14 +441,7 @@ class Calendar(AbstractCalendar, Widget):
 
     def set_language(self, language):
         if self._widget is not None:
-            if language == 'English':
-                self.configure(locale='en_UK')
-            elif language == 'Italiano':
-                self.configure(locale='it_IT')
-            elif language == 'Deutsch':
-                self.configure(locale='de_DE')
-            else:
-                self.configure(locale='en_UK')
+            self.configure(locale=_CALENDAR_LOCALES.get(language, 'en_UK'))
 
 
 class SpinControl(AbstractSpinControl, Widget):
@@ -519,15 +533,15 @@ class Menu(AbstractMenu, Widget):
     def _force_close(self):
         self._wait_var.set(1)
 
-    def _append_menubar(self, menubar, item, is_enabled, on_item_click):
-        if item == self.SEPARATOR:
+    def _append_menubar(self, menubar, kind, item, is_enabled, on_item_click):
+        if kind == self._SEPARATOR_ITEM:
             return
-        menubar._append_menu(item, is_enabled, on_item_click)
+        menubar._append_menu(kind, item, is_enabled, on_item_click)
 
-    def _append_menu(self, item, is_enabled, on_item_click):
-        if item == self.SEPARATOR:
+    def _append_menu(self, kind, item, is_enabled, on_item_click):
+        if kind == self._SEPARATOR_ITEM:
             self.add_separator()
-        elif isinstance(item, Menu):
+        elif kind == self._MENU_ITEM:
             item.build_menu(inherited_on_click=self.on_click)
             self.add_cascade(label=item.label, menu=item._widget)
         else:
@@ -588,6 +602,15 @@ class TextTimedMenu(AbstractTextTimedMenu, Widget):
         text.pack(expand=True, fill='x')
         return text
 
+    def _call_after(self, function):
+        return self._widget.after_idle(function)
+
+    def _schedule(self, delay, function):
+        return self._widget.after(int(delay * 1000), function)
+
+    def _cancel(self, timer):
+        self._widget.after_cancel(timer)
+
     def _close(self):
         super()._close()
         self._widget.event_generate('<<CloseWidget>>')
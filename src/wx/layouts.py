@@ -1,16 +1,18 @@
 import wx
 
-from ..abstract.layouts import AbstractBoxLayout, AbstractGridLayout, Align
+from ..abstract.layouts import AbstractBoxLayout, AbstractGridLayout, \
+    LEFT_MASK, HCENTER_MASK, RIGHT_MASK, TOP_MASK, VCENTER_MASK, BOTTOM_MASK, EXPAND_MASK, NO_STRETCH
 
 
 class Layout:
+    __slots__ = ()
     _BORDER_FLAGS = [wx.TOP, wx.RIGHT, wx.BOTTOM, wx.LEFT]
 
     def create_layout(self, parent):
         raise NotImplementedError()
 
     def apply_align(self, align):
-        if align & Align.EXPAND:
+        if align & EXPAND_MASK:
             flag = wx.EXPAND
         else:
             flag = 0
@@ -30,7 +32,7 @@ class Layout:
         if any(b != 0 for b in border_tuple):
             widget, widget_border, flag_border = self._apply_border(widget, border_tuple, align)
             box = wx.BoxSizer(wx.VERTICAL)
-            if align & Align.EXPAND:
+            if align & EXPAND_MASK:
                 flag_border |= wx.EXPAND
             box.Add(widget, border=widget_border, flag=flag_border)
             widget = box
@@ -39,33 +41,29 @@ class Layout:
 
 
 class BoxLayout(AbstractBoxLayout, Layout):
+    __slots__ = ()
     _DIRECTION = None
 
     def create_layout(self, parent):
         sizer = wx.BoxSizer(self._DIRECTION)
-        for widget_dict in self._widgets:
-            widget = widget_dict['type']
-            if widget == 'space':
-                sizer.AddSpacer(widget_dict['space'])
-            elif widget == 'stretch':
-                sizer.AddStretchSpacer(widget_dict['stretch'])
+        for kind, widget, widget_align, widget_border, widget_stretch, space in self.items():
+            if kind == 'space':
+                sizer.AddSpacer(space)
+            elif kind == 'stretch':
+                sizer.AddStretchSpacer(widget_stretch)
             else:
-                widget_align = widget_dict['align']
                 flag = self.apply_align(widget_align)
 
                 if isinstance(widget, Layout):
                     widget = widget.create_layout(None)
 
-                widget_border = widget_dict['border']
-                if isinstance(widget_border, int):
-                    flag |= wx.ALL
-                elif any(b != 0 for b in widget_border):
+                if any(b != 0 for b in widget_border):
                     widget, widget_border, flag_border = self._apply_border(widget, widget_border, widget_align)
                     flag |= flag_border
                 else:
                     widget_border = 0
 
-                sizer.Add(widget, proportion=widget_dict['stretch'], flag=flag, border=widget_border)
+                sizer.Add(widget, proportion=widget_stretch, flag=flag, border=widget_border)
 
         if parent is not None:
             parent.SetSizer(sizer)
@@ -73,46 +71,49 @@ class BoxLayout(AbstractBoxLayout, Layout):
 
 
 class VBoxLayout(BoxLayout):
+    __slots__ = ()
     _DIRECTION = wx.VERTICAL
 
     def apply_align(self, align):
         flag = super().apply_align(align)
         if flag == 0:
-            if align & Align.LEFT:
+            if align & LEFT_MASK:
                 flag = wx.ALIGN_LEFT
-            elif align & Align.HCENTER:
+            elif align & HCENTER_MASK:
                 flag = wx.ALIGN_CENTER_HORIZONTAL
-            elif align & Align.RIGHT:
+            elif align & RIGHT_MASK:
                 flag = wx.ALIGN_RIGHT
         return flag
 
 
 class HBoxLayout(BoxLayout):
+    __slots__ = ()
     _DIRECTION = wx.HORIZONTAL
 
     def apply_align(self, align):
         flag = super().apply_align(align)
         if flag == 0:
-            if align & Align.TOP:
+            if align & TOP_MASK:
                 flag = wx.ALIGN_TOP
-            elif align & Align.VCENTER:
+            elif align & VCENTER_MASK:
                 flag = wx.ALIGN_CENTER_VERTICAL
-            elif align & Align.BOTTOM:
+            elif align & BOTTOM_MASK:
                 flag = wx.ALIGN_BOTTOM
         return flag
 
 
 class GridLayout(AbstractGridLayout, Layout):
+    __slots__ = ()
 
     def create_layout(self, parent):
         sizer = wx.FlexGridSizer(self._rows, self._cols, self._vgap, self._hgap)
 
         for row in range(self._rows):
-            if self._row_stretch[row] is not None:
+            if self._row_stretch[row] != NO_STRETCH:
                 sizer.AddGrowableRow(row, self._row_stretch[row])
 
         for col in range(self._cols):
-            if self._row_stretch[col] is not None:
+            if self._col_stretch[col] != NO_STRETCH:
                 sizer.AddGrowableCol(col, self._col_stretch[col])
 
         for widgets_row in self._widgets:
@@ -130,9 +131,7 @@ class GridLayout(AbstractGridLayout, Layout):
                         widget = widget.create_layout(None)
 
                     widget_border = widget_dict['border']
-                    if isinstance(widget_border, int):
-                        flag |= wx.ALL
-                    elif any(b != 0 for b in widget_border):
+                    if any(b != 0 for b in widget_border):
                         widget, widget_border, flag_border = self._apply_border(widget, widget_border, widget_align)
                         flag |= flag_border
                     else:
@@ -147,16 +146,16 @@ class GridLayout(AbstractGridLayout, Layout):
     def apply_align(self, align):
         flag = super().apply_align(align)
         if flag == 0:
-            if align & Align.TOP:
+            if align & TOP_MASK:
                 flag = wx.ALIGN_TOP
-            elif align & Align.VCENTER:
+            elif align & VCENTER_MASK:
                 flag = wx.ALIGN_CENTER_VERTICAL
-            elif align & Align.BOTTOM:
+            elif align & BOTTOM_MASK:
                 flag = wx.ALIGN_BOTTOM
-            if align & Align.LEFT:
+            if align & LEFT_MASK:
                 flag |= wx.ALIGN_LEFT
-            elif align & Align.HCENTER:
+            elif align & HCENTER_MASK:
                 flag |= wx.ALIGN_CENTER_HORIZONTAL
-            elif align & Align.RIGHT:
+            elif align & RIGHT_MASK:
                 flag |= wx.ALIGN_RIGHT
         return flag
@@ -1,8 +1,20 @@
 import wx.grid
+from functools import lru_cache
 
 from ..abstract.tables import Align, TextStyle, Renderer, AbstractGrid
 from .widgets import Widget
 
+_ALIGNMENTS = {
+    Align.LEFT: wx.ALIGN_LEFT,
+    Align.CENTER: wx.ALIGN_CENTER,
+    Align.RIGHT: wx.ALIGN_RIGHT
+}
+
+
+@lru_cache(maxsize=None)
+def _wx_colour(*rgb):
+    return wx.Colour(*rgb)
+
 
 class GridTable(wx.grid.GridTableBase):
     pass
@@ -20,6 +32,13 @@ class Grid(AbstractGrid, Widget, wx.grid.Grid):
         self._wx_font_italic = wx.Font(wx.FontInfo(self._FONT_SIZE).Italic())
         self._wx_font_bold_italic = wx.Font(wx.FontInfo(self._FONT_SIZE).Bold().Italic())
 
+        self._font_dict = {
+            TextStyle.NORMAL: self._wx_font,
+            TextStyle.BOLD: self._wx_font_bold,
+            TextStyle.ITALIC: self._wx_font_italic,
+            TextStyle.BOLD_ITALIC: self._wx_font_bold_italic
+        }
+
         self._grid_table = self._get_grid_table()
 
         self.EnableEditing(False)
@@ -40,14 +59,20 @@ class Grid(AbstractGrid, Widget, wx.grid.Grid):
 
     def _get_grid_table(self):
         grid_table = GridTable()
-        grid_table.GetNumberRows = self._get_number_rows
-        grid_table.GetNumberCols = self._get_number_cols
+        grid_table.GetNumberRows = self._get_table_number_rows
+        grid_table.GetNumberCols = self._get_table_number_cols
         grid_table.GetValue = self._get_value
         grid_table.GetColLabelValue = self._get_col_label_value
         grid_table.GetRowLabelValue = self._get_row_label_value
         grid_table.GetAttr = self._get_attr
         return grid_table
 
+    def _get_table_number_rows(self):
+        return self._shape_cache[0]
+
+    def _get_table_number_cols(self):
+        return self._shape_cache[1]
+
     def _on_cell_left_click(self, event):
         row = event.GetRow()
         col = event.GetCol()
@@ -93,6 +118,8 @@ class Grid(AbstractGrid, Widget, wx.grid.Grid):
         pass
 
     def refresh(self):
+        self._cell_meta_cache.clear()
+        self._refresh_shape()
         self._refresh_attributes()
         self.BeginBatch()
         self.SetTable(self._grid_table, False)
@@ -129,35 +156,20 @@ class Grid(AbstractGrid, Widget, wx.grid.Grid):
         self.EndBatch()
 
     def _refresh_attributes(self):
-        for row in range(self._get_number_rows()):
-            for col in range(self._get_number_cols()):
+        number_rows, number_cols = self._shape_cache
+        for row in range(number_rows):
+            for col in range(number_cols):
                 self.RefreshAttr(row, col)
 
     def _get_attr(self, row, col, kind):
-        colour = self._get_colour(row, col)
-        style = self._get_style(row, col)
-        align = self._get_align(row, col)
-        renderer = self._get_renderer(row, col)
+        colour, style, align, renderer = self._cell_meta(row, col)
 
         attr = wx.grid.GridCellAttr()
-        attr.SetTextColour(wx.Colour(colour[0]))
-        attr.SetBackgroundColour(wx.Colour(colour[1]))
-
-        if style is TextStyle.BOLD:
-            attr.SetFont(self._wx_font_bold)
-        elif style is TextStyle.ITALIC:
-            attr.SetFont(self._wx_font_italic)
-        elif style is TextStyle.BOLD_ITALIC:
-            attr.SetFont(self._wx_font_bold_italic)
-        else:
-            attr.SetFont(self._wx_font)
+        attr.SetTextColour(_wx_colour(*colour[0]))
+        attr.SetBackgroundColour(_wx_colour(*colour[1]))
 
-        if align is Align.RIGHT:
-            attr.SetAlignment(wx.ALIGN_RIGHT, wx.ALIGN_CENTER)
-        elif align is Align.LEFT:
-            attr.SetAlignment(wx.ALIGN_LEFT, wx.ALIGN_CENTER)
-        else:
-            attr.SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
+        attr.SetFont(self._font_dict.get(style, self._wx_font))
+        attr.SetAlignment(_ALIGNMENTS.get(align, wx.ALIGN_CENTER), wx.ALIGN_CENTER)
 
         if renderer is Renderer.BOOLEAN:
             attr.SetRenderer(wx.grid.GridCellBoolRenderer())
@@ -173,6 +185,10 @@ class Grid(AbstractGrid, Widget, wx.grid.Grid):
     def _get_col_size(self, col):
         return self.GetColSize(col)
 
+    def _get_all_col_sizes(self):
+        col_sizes = self.GetColSizes()
+        return [col_sizes.GetSize(col) for col in range(self._get_number_cols())]
+
     def _set_row_size(self, row, size):
         self.SetRowSize(row, size)
 
@@ -184,6 +200,12 @@ class Grid(AbstractGrid, Widget, wx.grid.Grid):
     def _set_col_size(self, col, size):
         self.SetColSize(col, size)
 
+    def _begin_batch(self):
+        self.BeginBatch()
+
+    def _end_batch(self):
+        self.EndBatch()
+
     def _set_col_sizes(self, size):
         col_sizes = wx.grid.GridSizesInfo()
         col_sizes.m_sizeDefault = size
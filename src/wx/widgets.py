@@ -6,6 +6,10 @@ from ..abstract.widgets import AbstractWidget, AbstractMouseEventsWidget, Abstra
     AbstractText, AbstractCalendar, AbstractSpinControl, AbstractMenu, TextStyle, AbstractTextTimedMenu
 
 
+def _ignore_event(event):
+    pass
+
+
 def build_font(size, style):
     font = wx.Font(wx.FontInfo(size))
     if style is TextStyle.BOLD:
@@ -224,6 +228,10 @@ class TextWidget(AbstractText):
         else:
             self.SetBackgroundColour(wx.NullColour)
 
+    def _apply_colors(self):
+        self.SetForegroundColour(self.foreground_color or wx.NullColour)
+        self.SetBackgroundColour(self.background_color or wx.NullColour)
+
 
 class TextControl(TextWidget, LabelledWidget, wx.TextCtrl):
 
@@ -309,8 +317,8 @@ class SpinControl(AbstractSpinControl, Widget, wx.SpinCtrl):
     def __init__(self, panel, **kwargs):
         wx.SpinCtrl.__init__(self, panel, style=wx.SP_ARROW_KEYS)
         super().__init__(**kwargs)
-        self.Bind(wx.EVT_CHAR, lambda event: None)
-        self.Bind(wx.EVT_SET_FOCUS, lambda event: None)
+        self.Bind(wx.EVT_CHAR, _ignore_event)
+        self.Bind(wx.EVT_SET_FOCUS, _ignore_event)
         self.Bind(wx.EVT_SPINCTRL, self._on_click)
 
     def _on_click(self, event):
@@ -364,10 +372,10 @@ class Menu(AbstractMenu, Widget, wx.Menu):
         self._parent.PopupMenu(self)
         self.Destroy()
 
-    def _append_menubar(self, menubar, item, is_enabled, on_item_click):
-        if item == self.SEPARATOR:
+    def _append_menubar(self, menubar, kind, item, is_enabled, on_item_click):
+        if kind == self._SEPARATOR_ITEM:
             return
-        elif isinstance(item, Menu):
+        elif kind == self._MENU_ITEM:
             item.build_menu(inherited_on_click=self.on_click)
             menubar.Append(item, item.label)
             menubar.EnableTop(menubar.GetMenuCount() - 1, is_enabled)
@@ -380,10 +388,10 @@ class Menu(AbstractMenu, Widget, wx.Menu):
             self._return_items[entry.GetId()] = item
             self.Enable(entry.GetId(), is_enabled)
 
-    def _append_menu(self, item, is_enabled, on_item_click):
-        if item == self.SEPARATOR:
+    def _append_menu(self, kind, item, is_enabled, on_item_click):
+        if kind == self._SEPARATOR_ITEM:
             entry = self.Append(wx.ID_SEPARATOR)
-        elif isinstance(item, Menu):
+        elif kind == self._MENU_ITEM:
             item.build_menu(inherited_on_click=self.on_click)
             entry = self.AppendSubMenu(item, item.label)
         else:
@@ -438,23 +446,41 @@ class TextTimedMenu(AbstractTextTimedMenu, wx.PopupWindow):
         self._sizer.Add(text_panel, flag=wx.EXPAND)
         return text
 
+    def _call_after(self, function):
+        wx.CallAfter(function)
+
+    def _schedule(self, delay, function):
+        return wx.CallLater(int(delay * 1000), function)
+
+    def _cancel(self, timer):
+        timer.Stop()
+
+    def _begin_batch(self):
+        self.Freeze()
+
+    def _end_batch(self):
+        self.Thaw()
+
     def _set_normal_color(self, text):
         super()._set_normal_color(text)
         panel = text.GetParent()
-        panel.SetForegroundColour(self._FOREGROUND_NORMAL_COLOR)
-        panel.SetBackgroundColour(self._BACKGROUND_NORMAL_COLOR)
+        foreground_color, background_color = self._normal_colors
+        panel.SetForegroundColour(foreground_color)
+        panel.SetBackgroundColour(background_color)
 
     def _set_highlight_color(self, text):
         super()._set_highlight_color(text)
         panel = text.GetParent()
-        panel.SetForegroundColour(self._FOREGROUND_HIGHLIGHT_COLOR)
-        panel.SetBackgroundColour(self._BACKGROUND_HIGHLIGHT_COLOR)
+        foreground_color, background_color = self._highlight_colors
+        panel.SetForegroundColour(foreground_color)
+        panel.SetBackgroundColour(background_color)
 
     def _set_disabled_color(self, text):
         super()._set_disabled_color(text)
         panel = text.GetParent()
-        panel.SetForegroundColour(self._FOREGROUND_DISABLED_COLOR)
-        panel.SetBackgroundColour(self._BACKGROUND_DISABLED_COLOR)
+        foreground_color, background_color = self._disabled_colors
+        panel.SetForegroundColour(foreground_color)
+        panel.SetBackgroundColour(background_color)
 
     def _close(self):
         super()._close()